@@ -8,13 +8,16 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import threading
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any, AsyncIterator, Dict, List, Protocol, runtime_checkable
 
 from openai import AsyncAzureOpenAI, APIError, APIConnectionError, RateLimitError, APIStatusError
 from openai.types.chat import ChatCompletionMessageParam
 
 from clinical_note_quality import get_settings
+from .http import build_async_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +56,7 @@ class AsyncAzureLLMClient(AsyncLLMClientProtocol):
             api_version=settings.AZURE_OPENAI_API_VERSION,
             timeout=self._TIMEOUT,
             max_retries=0,  # We handle retries manually
+            http_client=build_async_http_client(),
         )
         
         # Separate client for embeddings if different endpoint is configured
@@ -63,7 +67,10 @@ class AsyncAzureLLMClient(AsyncLLMClientProtocol):
             api_version=settings.EMBEDDING_API_VERSION,
             timeout=self._TIMEOUT,
             max_retries=0,
+            http_client=build_async_http_client(),
         )
+        self._embedding_batch_size = max(1, settings.EMBEDDING_BATCH_SIZE)
+        self._embedding_max_concurrency = max(1, settings.EMBEDDING_MAX_CONCURRENCY)
 
     async def chat_complete(self, *, messages: List[ChatCompletionMessageParam], model: str, **kwargs: Any) -> str:
         """Return content string from async chat completion with exponential backoff."""
@@ -97,7 +104,27 @@ class AsyncAzureLLMClient(AsyncLLMClientProtocol):
                 raise
 
     async def create_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
-        """Create embeddings for the given texts with exponential backoff."""
+        """Create embeddings for the given texts.
+
+        Texts are split into ``EMBEDDING_BATCH_SIZE`` sub-batches that are sent
+        concurrently (at most ``EMBEDDING_MAX_CONCURRENCY`` in flight); results are
+        returned in input order.
+        """
+        size = self._embedding_batch_size
+        if len(texts) <= size:
+            return await self._embed_batch(texts, model)
+
+        semaphore = asyncio.Semaphore(self._embedding_max_concurrency)
+
+        async def _bounded(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_batch(batch, model)
+
+        batches = await asyncio.gather(*(_bounded(texts[i:i + size]) for i in range(0, len(texts), size)))
+        return [embedding for batch in batches for embedding in batch]
+
+    async def _embed_batch(self, texts: List[str], model: str) -> List[List[float]]:
+        """Embed one sub-batch with exponential backoff."""
         retry = 0
         while True:
             try:
@@ -154,27 +181,69 @@ class SyncAzureLLMClientWrapper:
 
 
 # Factory functions
-_async_client_instance: AsyncAzureLLMClient | None = None
+# The shared client's httpx pools are bound to the event loop they first run on, while
+# callers such as `GradingService.grade` start a fresh `asyncio.run` loop per request.
+# Every call on the shared client is therefore executed on one dedicated background
+# loop (the same arrangement as `grading.o3_judge._judge_loop`).
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+_CLIENT_LOOP_LOCK = threading.Lock()
+
+
+def _client_loop() -> asyncio.AbstractEventLoop:
+    global _CLIENT_LOOP
+    with _CLIENT_LOOP_LOCK:
+        if _CLIENT_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="azure-llm-client-loop", daemon=True).start()
+            _CLIENT_LOOP = loop
+        return _CLIENT_LOOP
+
+
+class LoopBoundAzureLLMClient(AsyncLLMClientProtocol):
+    """`AsyncAzureLLMClient` proxy that runs every call on the shared client loop.
+
+    Safe to await from any event loop; the underlying connection pools only ever
+    see the dedicated loop.
+    """
+
+    def __init__(self) -> None:
+        self._client = AsyncAzureLLMClient()
+        self._loop = _client_loop()
+
+    async def _on_client_loop(self, coro: Any) -> Any:
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    async def chat_complete(self, *, messages: List[ChatCompletionMessageParam], model: str, **kwargs: Any) -> str:
+        return await self._on_client_loop(self._client.chat_complete(messages=messages, model=model, **kwargs))
+
+    async def create_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
+        return await self._on_client_loop(self._client.create_embeddings(texts, model))
+
+    async def close(self) -> None:
+        await self._on_client_loop(self._client.close())
+
+
+@lru_cache(maxsize=1)
+def shared_async_azure_llm_client() -> LoopBoundAzureLLMClient:
+    """Return the process-wide client so every caller reuses one pair of connection pools.
+
+    Detectors default to this instance instead of building their own, which
+    keeps TLS sessions and keep-alive sockets warm across requests.  It lives
+    until `close_async_azure_client` is awaited.
+    """
+    return LoopBoundAzureLLMClient()
 
 
 @asynccontextmanager
-async def get_async_azure_llm_client() -> AsyncIterator[AsyncAzureLLMClient]:
+async def get_async_azure_llm_client() -> AsyncIterator[LoopBoundAzureLLMClient]:
     """Get async Azure LLM client with proper resource management."""
-    global _async_client_instance
-    
-    if _async_client_instance is None:
-        _async_client_instance = AsyncAzureLLMClient()
-    
-    try:
-        yield _async_client_instance
-    finally:
-        # Don't close here - let the application manage the lifecycle
-        pass
+    # Don't close here - the shared client lives for the whole process
+    yield shared_async_azure_llm_client()
 
 
 async def close_async_azure_client() -> None:
-    """Clean up the global async client instance."""
-    global _async_client_instance
-    if _async_client_instance:
-        await _async_client_instance.close()
-        _async_client_instance = None 
\ No newline at end of file
+    """Clean up the shared async client instance."""
+    if shared_async_azure_llm_client.cache_info().currsize:
+        client = shared_async_azure_llm_client()
+        shared_async_azure_llm_client.cache_clear()
+        await client.close()
@@ -17,6 +17,7 @@ from openai.types.chat import ChatCompletionMessageParam
 
 from clinical_note_quality import get_settings
 from .async_client import AsyncLLMClientProtocol, get_async_azure_llm_client, close_async_azure_client
+from .http import build_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,8 @@ class _AzureLLMClient(LLMClientProtocol):
             api_key=settings.AZURE_OPENAI_KEY,
             azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
             api_version=settings.AZURE_OPENAI_API_VERSION,
+            http_client=build_http_client(),
+            max_retries=0,  # We handle retries manually
         )
 
     # ------------------------------------------------------------------
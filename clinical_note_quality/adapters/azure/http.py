@@ -0,0 +1,40 @@
+"""Shared httpx transports for the Azure OpenAI SDK clients.
+
+The SDK's default `httpx` client speaks HTTP/1.1 with a small connection pool,
+which becomes a head-of-line bottleneck once grading fans out concurrently.
+These factories build explicitly pooled clients (HTTP/2 when `h2` is
+installed) that are handed to `AzureOpenAI` / `AsyncAzureOpenAI` via
+``http_client=``.  Retries are disabled at the transport level because the
+adapters own their retry/back-off policy.
+"""
+from __future__ import annotations
+
+import httpx
+
+try:
+    import h2  # noqa: F401  # type: ignore
+
+    HTTP2_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=30, keepalive_expiry=85)
+_TIMEOUT = httpx.Timeout(connect=5.0, read=120.0, write=30.0, pool=5.0)
+
+
+def build_http_client() -> httpx.Client:
+    """Return a pooled synchronous httpx client for `AzureOpenAI`."""
+
+    return httpx.Client(
+        timeout=_TIMEOUT,
+        transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=_LIMITS, retries=0),
+    )
+
+
+def build_async_http_client() -> httpx.AsyncClient:
+    """Return a pooled asynchronous httpx client for `AsyncAzureOpenAI`."""
+
+    return httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=_LIMITS, retries=0),
+    )
@@ -0,0 +1,101 @@
+"""Content-hash keyed on-disk cache for embedding calls.
+
+Semantic gap detection re-embeds the same note/transcript chunks whenever a
+note is re-graded, and embedding round-trips dominate that path.
+`CachedEmbeddingClient` wraps any `AsyncLLMClientProtocol` and stores each
+vector as ``<cache_dir>/<sha256(model:text)>.npy`` so only unseen chunks are
+sent upstream.  Keying on the model name means switching embedding deployments
+never serves stale vectors.  Vectors are stored as float32, the precision the
+detectors score at, so a cache hit scores exactly like a fresh embedding.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from clinical_note_quality import get_settings
+from clinical_note_quality.adapters.azure.async_client import (
+    AsyncLLMClientProtocol,
+    shared_async_azure_llm_client,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CachedEmbeddingClient", "default_embedding_client"]
+
+
+class CachedEmbeddingClient(AsyncLLMClientProtocol):
+    """Delegating client that serves `create_embeddings` from a disk cache."""
+
+    def __init__(self, inner: AsyncLLMClientProtocol, cache_dir: str | os.PathLike[str]) -> None:
+        self._inner = inner
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, text: str, model: str) -> Path:
+        key = hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
+        return self._dir / f"{key}.npy"
+
+    @staticmethod
+    def _load(paths: Sequence[Path]) -> List[Optional[List[float]]]:
+        loaded: List[Optional[List[float]]] = []
+        for path in paths:
+            try:
+                loaded.append(np.load(path).tolist())
+            except (OSError, ValueError):  # missing or partially written entry
+                loaded.append(None)
+        return loaded
+
+    @staticmethod
+    def _store(entries: Sequence[tuple[Path, List[float]]]) -> None:
+        for path, embedding in entries:
+            tmp: Optional[str] = None
+            try:
+                # Unique temp name per write, so concurrent writers of one key never share a file
+                with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fh:
+                    tmp = fh.name
+                    np.save(fh, np.asarray(embedding, dtype=np.float32))
+                os.replace(tmp, path)  # atomic, so readers never see a partial file
+            except OSError as exc:
+                logger.warning("Embedding cache write failed for %s: %s", path.name, exc)
+                if tmp is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp)
+
+    async def create_embeddings(self, texts: List[str], model: str) -> List[List[float]]:
+        """Return embeddings for *texts*, embedding only cache misses upstream."""
+        paths = [self._path(text, model) for text in texts]
+        embeddings = await asyncio.to_thread(self._load, paths)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if misses:
+            fresh = await self._inner.create_embeddings([texts[i] for i in misses], model)
+            if len(fresh) != len(misses):
+                raise ValueError(
+                    f"Embedding client returned {len(fresh)} embeddings for {len(misses)} texts"
+                )
+            for i, embedding in zip(misses, fresh):
+                embeddings[i] = embedding
+            await asyncio.to_thread(self._store, [(paths[i], embeddings[i]) for i in misses])
+        logger.debug("Embedding cache: %d hits, %d misses", len(texts) - len(misses), len(misses))
+        return embeddings  # type: ignore[return-value]
+
+    async def chat_complete(self, **kwargs: Any) -> str:
+        return await self._inner.chat_complete(**kwargs)
+
+    async def close(self) -> None:
+        await self._inner.close()
+
+
+def default_embedding_client() -> AsyncLLMClientProtocol:
+    """Return the shared Azure client, disk-cached when ``EMBEDDING_CACHE_DIR`` is set."""
+    client = shared_async_azure_llm_client()
+    cache_dir = get_settings().EMBEDDING_CACHE_DIR
+    return CachedEmbeddingClient(client, cache_dir) if cache_dir else client
@@ -25,7 +25,7 @@ class MedicalCategory(str, Enum):
     FAMILY_HISTORY = "family_history"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SemanticGap:
     """Represents medically important information present in transcript but missing from note.
     
@@ -69,7 +69,7 @@ class SemanticGap:
         return self.importance_score >= 0.8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SemanticGapResult:
     """Aggregate result from semantic gap detection analysis.
     
@@ -148,7 +148,7 @@ class RiskLevel(str, Enum):
     LOW = "low"         # Minor documentation issue
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Contradiction:
     """Represents conflicting information between note and transcript.
     
@@ -197,7 +197,7 @@ class Contradiction:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hallucination:
     """Represents unsupported claims in the clinical note.
     
@@ -244,7 +244,7 @@ class Hallucination:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContradictionResult:
     """Complete result of contradiction analysis.
     
@@ -294,7 +294,7 @@ class ContradictionResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HallucinationResult:
     """Complete result of hallucination analysis.
     
@@ -344,7 +344,7 @@ class HallucinationResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscrepancyAnalysisResult:
     """Comprehensive discrepancy analysis combining all three layers.
     
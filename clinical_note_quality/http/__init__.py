@@ -6,6 +6,7 @@ from typing import Any
 
 from flask import Flask
 
+from .json_provider import ORJSON_AVAILABLE, OrjsonProvider
 from .routes import bp as web_bp
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,9 @@ def create_app(*, debug: bool | None = None) -> Flask:
 
     app.config.from_object(Config)
 
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     if debug is not None:
         app.debug = debug
 
@@ -0,0 +1,59 @@
+"""orjson-backed JSON provider for the Flask app.
+
+Grading responses carry full PDQI explanations and heuristic breakdowns, so
+encoding them is a visible share of request CPU.  ``OrjsonProvider`` swaps
+Flask's stdlib-json provider for ``orjson`` when it is installed and writes
+the encoded bytes straight into the response body.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+__all__ = ["OrjsonProvider", "ORJSON_AVAILABLE"]
+
+_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """`DefaultJSONProvider` with orjson encode/decode; types orjson rejects use Flask's default hook.
+
+    Honours the inherited ``sort_keys`` and ``compact`` settings, so output matches the
+    stdlib provider: sorted keys by default and 2-space indentation in debug mode.
+    """
+
+    def _option(self, *, sort_keys: bool, indent: bool) -> int:
+        option = _OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = self._option(
+            sort_keys=kwargs.get("sort_keys", self.sort_keys), indent=bool(kwargs.get("indent"))
+        )
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        option = self._option(sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option) + b"\n",
+            mimetype=self.mimetype,
+        )
@@ -241,18 +241,22 @@ def grade_via_api():
 
 # ---------------------------------------------------------------------------
 # Internal helper to keep legacy tests (which patch app.grade_note_hybrid)
-# working while preferring the new GradingService in production.
+# working while preferring the new GradingService in production.  Tests may
+# also inject a grader callable via ``app.config["GRADER"]`` instead of patching.
 # ---------------------------------------------------------------------------
 
 
 def _grade_note(note: str, transcript: str | None, precision: str) -> Dict[str, Any]:
-    """Dispatch to patched legacy function when present else use new service."""
+    """Dispatch to an injected or patched legacy grader when present else use new service."""
 
-    import importlib
+    grader = current_app.config.get("GRADER")
+    if grader is None:
+        import importlib
 
-    app_mod = importlib.import_module("app")
+        app_mod = importlib.import_module("app")
+        grader = getattr(app_mod, "grade_note_hybrid", None)
 
-    if hasattr(app_mod, "grade_note_hybrid"):
+    if grader is not None:
         kwargs = {
             "clinical_note": note,
             "encounter_transcript": transcript,
@@ -260,7 +264,7 @@ def _grade_note(note: str, transcript: str | None, precision: str) -> Dict[str,
         # Legacy route only forwarded model_precision when not default
         if precision != "medium":
             kwargs["model_precision"] = precision
-        return app_mod.grade_note_hybrid(**kwargs)
+        return grader(**kwargs)
 
     # Ensure we get the data structure the templates expect
     result = _service.grade(note, transcript or "", precision)
@@ -14,10 +14,9 @@ from __future__ import annotations
 import logging
 import time
 from typing import List, Optional, Dict, Set
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from clinical_note_quality.adapters.azure.async_client import AsyncAzureLLMClient
+from clinical_note_quality.adapters.embedding_cache import default_embedding_client
 from clinical_note_quality.domain.semantic_models import (
     Contradiction,
     ContradictionResult,
@@ -54,9 +53,12 @@ class ContradictionDetector(ContradictionDetectorProtocol):
     SIMILARITY_RANGE = (0.65, 0.85)
 
     def __init__(self, llm_client: Optional[AsyncAzureLLMClient] = None) -> None:
-        """Initialize detector with optional LLM client injection."""
-        self._llm_client = llm_client or AsyncAzureLLMClient()
-        self._client_owned = llm_client is None  # Track if we own the client for cleanup
+        """Initialize detector with optional LLM client injection.
+
+        The default client is disk-cached when ``EMBEDDING_CACHE_DIR`` is set.
+        """
+        self._llm_client = llm_client or default_embedding_client()
+        self._client_owned = False  # Injected and shared clients are closed by their owners
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -152,20 +154,18 @@ class ContradictionDetector(ContradictionDetectorProtocol):
                 model=settings.EMBEDDING_DEPLOYMENT
             )
             
-            note_embeddings = np.array(embeddings[:len(note_statements)])
-            transcript_embeddings = np.array(embeddings[len(note_statements):])
+            # Every note-vs-transcript cosine score from a single matmul
+            similarity_matrix = SimilarityAnalyzer.cosine_matrix(
+                embeddings[:len(note_statements)], embeddings[len(note_statements):]
+            )
             
         except Exception as e:
             logger.error(f"Failed to get embeddings: {e}")
             return []
         
         # Compare each note statement with transcript statements
-        for i, note_stmt in enumerate(note_statements):
-            note_embedding = note_embeddings[i:i+1]  # Keep 2D shape
-            
+        for note_stmt, similarities in zip(note_statements, similarity_matrix.tolist()):
             # Find transcript statements in the "contradiction zone"
-            similarities = cosine_similarity(note_embedding, transcript_embeddings)[0]
-            
             for j, similarity in enumerate(similarities):
                 # Check if similarity is in contradiction range
                 if SimilarityAnalyzer.is_in_similarity_range(similarity, self.SIMILARITY_RANGE):
@@ -7,6 +7,8 @@ rules defined in settings.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import math
 import logging
 import time
 from typing import Optional, Dict, Any, List
@@ -29,16 +31,15 @@ from clinical_note_quality.observability import (
 logger = get_logger(__name__)
 
 
+# Lower bound of each grade above F; a score equal to a cut belongs to the higher grade
+_GRADE_CUTS = (1.5, 2.5, 3.5, 4.5)
+_GRADES = ("F", "D", "C", "B", "A")
+
+
 def _numeric_grade(score: float) -> str:
-    if score >= 4.5:
-        return "A"
-    if score >= 3.5:
-        return "B"
-    if score >= 2.5:
-        return "C"
-    if score >= 1.5:
-        return "D"
-    return "F"
+    if math.isnan(score):  # bisect would place NaN in the top bucket
+        return _GRADES[0]
+    return _GRADES[bisect.bisect_right(_GRADE_CUTS, score)]
 
 
 class GradingService:  # noqa: D101 – obvious
@@ -238,8 +239,11 @@ class GradingService:  # noqa: D101 – obvious
         # Run both analyses concurrently with proper resource management
         try:
             async with self.contradiction_detector as cd, self.hallucination_detector as hd:
-                contradiction_result = await cd.detect_contradictions(note, transcript)
-                hallucination_result = await hd.detect_hallucinations(note, transcript)
+                async with asyncio.TaskGroup() as tg:
+                    contradiction_task = tg.create_task(cd.detect_contradictions(note, transcript))
+                    hallucination_task = tg.create_task(hd.detect_hallucinations(note, transcript))
+                contradiction_result = contradiction_task.result()
+                hallucination_result = hallucination_task.result()
                 
                 # Extract high-risk hallucinations for factuality verification
                 high_risk_claims = []
@@ -16,9 +16,9 @@ import time
 import re
 from typing import List, Optional, Dict, Set
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from clinical_note_quality.adapters.azure.async_client import AsyncAzureLLMClient
+from clinical_note_quality.adapters.embedding_cache import default_embedding_client
 from clinical_note_quality.domain.semantic_models import (
     Hallucination,
     HallucinationResult,
@@ -75,9 +75,12 @@ class HallucinationDetector(HallucinationDetectorProtocol):
     }
 
     def __init__(self, llm_client: Optional[AsyncAzureLLMClient] = None) -> None:
-        """Initialize detector with optional LLM client injection."""
-        self._llm_client = llm_client or AsyncAzureLLMClient()
-        self._client_owned = llm_client is None  # Track if we own the client for cleanup
+        """Initialize detector with optional LLM client injection.
+
+        The default client is disk-cached when ``EMBEDDING_CACHE_DIR`` is set.
+        """
+        self._llm_client = llm_client or default_embedding_client()
+        self._client_owned = False  # Injected and shared clients are closed by their owners
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -229,20 +232,19 @@ class HallucinationDetector(HallucinationDetectorProtocol):
                 model=settings.EMBEDDING_DEPLOYMENT
             )
             
-            claim_embeddings = np.array(embeddings[:len(note_claims)])
-            evidence_embeddings = np.array(embeddings[len(note_claims):])
+            # Every claim-vs-evidence cosine score from a single matmul
+            similarity_matrix = SimilarityAnalyzer.cosine_matrix(
+                embeddings[:len(note_claims)], embeddings[len(note_claims):]
+            )
             
         except Exception as e:
             logger.error(f"Failed to get embeddings: {e}")
             return []
         
         # Check each claim for supporting evidence
-        for i, claim in enumerate(note_claims):
-            claim_embedding = claim_embeddings[i:i+1]  # Keep 2D shape
-            
+        for claim, similarities in zip(note_claims, similarity_matrix):
             # Find best supporting evidence
-            similarities = cosine_similarity(claim_embedding, evidence_embeddings)[0]
-            max_similarity = np.max(similarities) if len(similarities) > 0 else 0.0
+            max_similarity = float(similarities.max()) if len(similarities) > 0 else 0.0
             
             # Determine if claim is hallucinated based on support level
             hallucination = self._analyze_claim_support(
@@ -12,11 +12,7 @@ from typing import Protocol, runtime_checkable
 
 from clinical_note_quality.domain import HeuristicResult
 
-from grading.heuristics import (  # Re-use validated logic for now
-    calculate_length_score,
-    calculate_redundancy_score,
-    calculate_structure_score,
-)
+from grading.heuristics import analyze_heuristics  # Re-use validated (memoized) logic for now
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +28,18 @@ class DefaultHeuristicService(HeuristicService):
     """Stateless implementation using rule-based metrics."""
 
     def analyze(self, note: str) -> HeuristicResult:  # noqa: D401
-        length_score = calculate_length_score(note)
-        redundancy_score = calculate_redundancy_score(note)
-        structure_score = calculate_structure_score(note)
+        heuristics = analyze_heuristics(note)
+        length_score = heuristics["length_score"]
+        redundancy_score = heuristics["redundancy_score"]
+        structure_score = heuristics["structure_score"]
         composite = (length_score + redundancy_score + structure_score) / 3
         result = HeuristicResult(
             length_score=round(length_score, 2),
             redundancy_score=round(redundancy_score, 2),
             structure_score=round(structure_score, 2),
             composite_score=round(composite, 2),
-            word_count=len(note.split()),
-            character_count=len(note),
+            word_count=heuristics["word_count"],
+            character_count=heuristics["character_count"],
         )
         logger.debug("Heuristic analysis result: %s", result)
         return result
@@ -14,10 +14,6 @@ from clinical_note_quality.adapters.azure import get_azure_llm_client
 from clinical_note_quality.domain import PDQIScore, PDQIDimension
 from clinical_note_quality import get_settings
 
-# For backward-compat we reuse existing O3Judge implementation until a full
-# rewrite happens in Phase 2.
-from grading.o3_judge import score_with_o3  # type: ignore
-
 logger = logging.getLogger(__name__)
 
 
@@ -36,8 +32,15 @@ class PDQIService(Protocol):
 class O3Strategy(PDQIService):
     """Adapter that delegates to legacy `score_with_o3` helper."""
 
+    def __init__(self) -> None:
+        # For backward-compat we reuse existing O3Judge implementation until a full
+        # rewrite happens in Phase 2.  Imported lazily so the Nine-Rings path never
+        # loads the O3 client stack.
+        from grading.o3_judge import score_with_o3  # type: ignore
+        self._score_with_o3 = score_with_o3
+
     def score(self, note: str, *, precision: str = "medium") -> PDQIScore:  # noqa: D401
-        raw = score_with_o3(note, model_precision=precision)
+        raw = self._score_with_o3(note, model_precision=precision)
         # Normalise values to floats for domain layer
         numeric_scores = {
             k: float(raw[k]) for k in PDQIDimension.numeric_keys() if k in raw
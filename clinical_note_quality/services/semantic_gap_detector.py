@@ -12,16 +12,16 @@ import re
 from typing import List, Optional, Set
 
 import nltk
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from clinical_note_quality.adapters.azure.async_client import AsyncAzureLLMClient
+from clinical_note_quality.adapters.embedding_cache import default_embedding_client
 from clinical_note_quality.domain.semantic_models import (
     SemanticGap,
     SemanticGapResult,
     MedicalCategory,
 )
 from clinical_note_quality.services.semantic_protocols import SemanticGapDetectorProtocol
+from clinical_note_quality.services.text_analysis_utils import SimilarityAnalyzer
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +59,12 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
     }
 
     def __init__(self, llm_client: Optional[AsyncAzureLLMClient] = None) -> None:
-        """Initialize detector with optional LLM client injection."""
-        self._llm_client = llm_client or AsyncAzureLLMClient()
+        """Initialize detector with optional LLM client injection.
+
+        The default client is wrapped in an on-disk embedding cache when
+        ``EMBEDDING_CACHE_DIR`` is configured; injected clients are used as-is.
+        """
+        self._llm_client = llm_client or default_embedding_client()
 
     async def detect_gaps(self, note: str, transcript: str) -> SemanticGapResult:
         """Detect semantic gaps between note and transcript.
@@ -88,14 +92,8 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
                 gaps = []
                 for chunk in transcript_chunks[:5]:  # Limit to prevent overwhelming results
                     if self._is_medically_significant(chunk):
-                        gap = SemanticGap(
-                            transcript_content=chunk,
-                            importance_score=self._calculate_importance(chunk),
-                            medical_category=self._categorize_content(chunk),
-                            suggested_section=self._suggest_section(chunk),
-                            confidence=0.95,  # High confidence - note is completely empty
-                        )
-                        gaps.append(gap)
+                        # High confidence - note is completely empty
+                        gaps.append(self._build_gap(chunk, confidence=0.95))
                 
                 critical_count = len([g for g in gaps if g.is_critical])
                 return SemanticGapResult(
@@ -133,9 +131,11 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
 
     async def _perform_gap_analysis(self, note: str, transcript: str) -> List[SemanticGap]:
         """Perform the core gap analysis using embeddings."""
-        # Extract meaningful chunks from both documents
-        note_chunks = self._extract_medical_chunks(note)
-        transcript_chunks = self._extract_medical_chunks(transcript)
+        # Extract meaningful chunks from both documents (sentence tokenization is
+        # pure-Python CPU work, so it runs in a worker thread)
+        note_chunks, transcript_chunks = await asyncio.to_thread(
+            lambda: (self._extract_medical_chunks(note), self._extract_medical_chunks(transcript))
+        )
 
         if not transcript_chunks:
             return []
@@ -147,43 +147,38 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
             from clinical_note_quality import get_settings
             settings = get_settings()
             
-            embeddings = await self._llm_client.create_embeddings(
-                texts=all_chunks,
+            # Repeated boilerplate chunks are embedded once and scattered back
+            unique_chunks = list(dict.fromkeys(all_chunks))
+            unique_embeddings = await self._llm_client.create_embeddings(
+                texts=unique_chunks,
                 model=settings.EMBEDDING_DEPLOYMENT
             )
+            by_chunk = dict(zip(unique_chunks, unique_embeddings))
+            embeddings = [by_chunk[chunk] for chunk in all_chunks]
         except Exception as e:
             logger.error(f"Failed to get embeddings: {e}")
             return []  # Return empty on embedding failure
 
-        # Split embeddings back into note and transcript
-        note_embeddings = np.array(embeddings[:len(note_chunks)])
-        transcript_embeddings = np.array(embeddings[len(note_chunks):])
+        # Cosine scoring is CPU-bound (list -> array conversion plus the matmul), so
+        # run it off the event loop to keep concurrent grading requests responsive
+        # (best match in the note for every transcript chunk)
+        if note_chunks:
+            similarities = await asyncio.to_thread(
+                SimilarityAnalyzer.cosine_matrix, embeddings[len(note_chunks):], embeddings[:len(note_chunks)]
+            )
+            max_similarities = similarities.max(axis=1).tolist()
+        else:
+            max_similarities = [0.0] * len(transcript_chunks)
 
         # Find gaps: transcript chunks with no similar note chunks
         gaps = []
-        for i, t_chunk in enumerate(transcript_chunks):
+        for t_chunk, max_similarity in zip(transcript_chunks, max_similarities):
             if not self._is_medically_significant(t_chunk):
                 continue
 
-            t_embedding = transcript_embeddings[i:i+1]  # Keep 2D shape
-            
-            # Calculate similarities with all note chunks
-            if len(note_embeddings) > 0:
-                similarities = cosine_similarity(t_embedding, note_embeddings)[0]
-                max_similarity = np.max(similarities)
-            else:
-                max_similarity = 0.0
-
             # If no similar chunk found in note, it's a gap
             if max_similarity < self.SIMILARITY_THRESHOLD:
-                gap = SemanticGap(
-                    transcript_content=t_chunk,
-                    importance_score=self._calculate_importance(t_chunk),
-                    medical_category=self._categorize_content(t_chunk),
-                    suggested_section=self._suggest_section(t_chunk),
-                    confidence=1.0 - max_similarity,
-                )
-                gaps.append(gap)
+                gaps.append(self._build_gap(t_chunk, confidence=1.0 - max_similarity))
 
         # Sort by importance (most critical first)
         gaps.sort(key=lambda g: g.importance_score, reverse=True)
@@ -270,7 +265,18 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
         
         return any(re.search(pattern, text_lower) for pattern in significant_patterns)
 
-    def _calculate_importance(self, text: str) -> float:
+    def _build_gap(self, chunk: str, *, confidence: float) -> SemanticGap:
+        """Build a gap for *chunk*, categorizing its content only once."""
+        category = self._categorize_content(chunk)
+        return SemanticGap(
+            transcript_content=chunk,
+            importance_score=self._calculate_importance(chunk, category),
+            medical_category=category,
+            suggested_section=self._suggest_section(chunk, category),
+            confidence=confidence,
+        )
+
+    def _calculate_importance(self, text: str, category: Optional[MedicalCategory] = None) -> float:
         """Calculate medical importance score (0-1) for text content."""
         text_lower = text.lower()
         
@@ -278,7 +284,8 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
         importance = 0.3
         
         # Category-based importance
-        category = self._categorize_content(text)
+        if category is None:
+            category = self._categorize_content(text)
         base_importance = self.MEDICAL_CATEGORY_IMPORTANCE.get(category, 0.3)
         importance = max(importance, base_importance)
         
@@ -326,9 +333,10 @@ class SemanticGapDetector(SemanticGapDetectorProtocol):
         
         return MedicalCategory.SYMPTOM  # Default category
 
-    def _suggest_section(self, text: str) -> str:
+    def _suggest_section(self, text: str, category: Optional[MedicalCategory] = None) -> str:
         """Suggest appropriate note section for the content."""
-        category = self._categorize_content(text)
+        if category is None:
+            category = self._categorize_content(text)
         
         section_mapping = {
             MedicalCategory.MEDICATION: "Current Medications",
@@ -10,9 +10,11 @@ Following Claude.md principles:
 from __future__ import annotations
 
 import re
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Sequence
 from enum import Enum
 
+import numpy as np
+
 from clinical_note_quality.domain.semantic_models import MedicalCategory
 
 
@@ -260,6 +262,22 @@ class TextAnalyzer:
 class SimilarityAnalyzer:
     """Utility class for analyzing similarity and detecting patterns."""
 
+    @staticmethod
+    def cosine_matrix(rows: Sequence[Sequence[float]], columns: Sequence[Sequence[float]]) -> np.ndarray:
+        """Cosine similarity of every row against every column as one float32 matmul.
+
+        Zero vectors score 0.0 against everything, matching sklearn's cosine_similarity.
+        """
+        if len(rows) == 0 or len(columns) == 0:
+            return np.zeros((len(rows), len(columns)), dtype=np.float32)
+        a = np.array(rows, dtype=np.float32)
+        b = np.array(columns, dtype=np.float32)
+        for matrix in (a, b):
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            np.divide(matrix, norms, out=matrix)
+        return a @ b.T
+
     @staticmethod
     def is_in_similarity_range(similarity: float, range_tuple: tuple) -> bool:
         """Check if similarity is within specified range."""
@@ -71,10 +71,20 @@ class Settings(BaseSettings):
     EMBEDDING_API_VERSION: str = Field(
         default="2025-01-01-preview", validation_alias="EMBEDDING_API_VERSION"
     )
+    # Texts per embeddings request, and how many of those requests may be in flight at once
+    EMBEDDING_BATCH_SIZE: int = Field(default=16, validation_alias="EMBEDDING_BATCH_SIZE")
+    EMBEDDING_MAX_CONCURRENCY: int = Field(default=4, validation_alias="EMBEDDING_MAX_CONCURRENCY")
+    # Directory for the on-disk embedding cache (e.g. ".cache/embeddings"); unset disables it
+    EMBEDDING_CACHE_DIR: str | None = Field(
+        default=None, validation_alias="EMBEDDING_CACHE_DIR"
+    )
 
     MAX_COMPLETION_TOKENS: int = Field(
         default=_LegacyConfig.MAX_COMPLETION_TOKENS, validation_alias="MAX_COMPLETION_TOKENS"
     )
+    MAX_NOTE_TOKENS: int = Field(
+        default=_LegacyConfig.MAX_NOTE_TOKENS, validation_alias="MAX_NOTE_TOKENS"
+    )
 
     MODEL_PRECISION: str = Field(
         default=_LegacyConfig.MODEL_PRECISION, validation_alias="MODEL_PRECISION"
@@ -24,6 +24,8 @@ class Config:
     AZURE_O3_API_VERSION = os.environ.get('AZ_O3_API_VERSION', '2025-04-01-preview')
     AZURE_OPENAI_API_VERSION = os.environ.get('AZ_OPENAI_API_VERSION', AZURE_O3_API_VERSION)
     MAX_COMPLETION_TOKENS = 8000  # Increased to prevent response truncation and ensure complete factuality assessments
+    # Notes longer than this are truncated before PDQI scoring so they fit the model context
+    MAX_NOTE_TOKENS = int(os.environ.get('MAX_NOTE_TOKENS', '100000'))
     # For o3-mini model, use model_low, model_medium, or model_high instead of temperature
     # Options: "low", "medium", "high"
     MODEL_PRECISION = os.environ.get('MODEL_PRECISION', 'medium')
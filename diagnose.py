@@ -3,6 +3,7 @@ Diagnostic script for the Clinical Note Quality App
 This script tests each component of the grading system independently
 to identify where issues might be occurring.
 """
+import asyncio
 import logging
 import sys
 import json
@@ -44,7 +45,6 @@ def test_openai_connection(model_precision="medium"):
     logger.info("Testing OpenAI connection...")
     
     try:
-        judge = O3Judge()
         # Select deployment based on model_precision
         if model_precision == "high":
             model_name = Config.AZURE_O3_HIGH_DEPLOYMENT
@@ -56,11 +56,19 @@ def test_openai_connection(model_precision="medium"):
         from typing import List
         
         messages: List[ChatCompletionMessageParam] = [{"role": "user", "content": "Hello, this is a test."}]
-        response = judge.client.chat.completions.create(
-            model=model_name,
-            messages=messages,
-            max_completion_tokens=10
-        )
+
+        async def _ping():
+            judge = O3Judge()
+            try:
+                return await judge.client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    max_completion_tokens=10
+                )
+            finally:
+                await judge.aclose()
+
+        response = asyncio.run(_ping())
         logger.info("Connection to OpenAI API successful!")
         return True
     except Exception as e:
@@ -4,6 +4,7 @@ warnings.warn(
     DeprecationWarning,
     stacklevel=2,
 )
+import openai
 from openai import AzureOpenAI, APIConnectionError, AuthenticationError, APIStatusError, RateLimitError, APIError
 from openai.types.chat import ChatCompletionMessageParam
 import json
@@ -67,7 +68,6 @@ def assess_consistency_with_o3(clinical_note: str, encounter_transcript: str, mo
         if (hasattr(Config, 'ENABLE_REASONING_SUMMARY') and Config.ENABLE_REASONING_SUMMARY and 
             hasattr(Config, 'REASONING_SUMMARY_TYPE')):
             try:
-                import openai
                 client_version = getattr(openai, '__version__', '0.0.0')
                 # Reasoning requires openai >= 1.52.0 and specific API versions
                 if client_version >= '1.52.0':
@@ -245,7 +245,6 @@ def assess_consistency_with_o3_enhanced(clinical_note: str, encounter_transcript
         if (hasattr(Config, 'ENABLE_REASONING_SUMMARY') and Config.ENABLE_REASONING_SUMMARY and 
             hasattr(Config, 'REASONING_SUMMARY_TYPE')):
             try:
-                import openai
                 client_version = getattr(openai, '__version__', '0.0.0')
                 # Reasoning requires openai >= 1.52.0 and specific API versions
                 if client_version >= '1.52.0':
@@ -4,13 +4,24 @@ warnings.warn(
     DeprecationWarning,
     stacklevel=2,
 )
+import hashlib
 import re
 import logging
+import threading
 from typing import Dict, Tuple
 from collections import Counter
 
+from cachetools import LRUCache
+
 logger = logging.getLogger(__name__)
 
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_LIST_ITEM_RE = re.compile(r'^\s*(?:[-*•]\s+|\d+\.)')
+
+# Re-grading the same note (new transcript or precision) repeats identical heuristic work
+_HEURISTICS_CACHE: LRUCache = LRUCache(maxsize=256)
+_HEURISTICS_CACHE_LOCK = threading.Lock()
+
 def calculate_length_score(text: str) -> float:
     """Calculate length appropriateness score (0-5) based on character count.
     
@@ -38,19 +49,18 @@ def calculate_length_score(text: str) -> float:
 def calculate_redundancy_score(text: str) -> float:
     """Calculate redundancy score based on repeated phrases (0-5)."""
     # Normalize text
-    text = re.sub(r'[^\w\s]', '', text.lower())
+    text = _PUNCT_RE.sub('', text.lower())
     words = text.split()
     
     if len(words) < 10:
         return 5.0
     
-    # Check for repeated 3-grams
-    trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
-    trigram_counts = Counter(trigrams)
+    # Check for repeated 3-grams (tuples hash without building a joined string per window)
+    trigram_counts = Counter(zip(words, words[1:], words[2:]))
     
-    # Calculate redundancy ratio
-    repeated_trigrams = sum(count - 1 for count in trigram_counts.values() if count > 1)
-    total_trigrams = len(trigrams)
+    # Calculate redundancy ratio: every occurrence beyond the first is a repeat
+    total_trigrams = len(words) - 2
+    repeated_trigrams = total_trigrams - len(trigram_counts)
     
     if total_trigrams == 0:
         return 5.0
@@ -79,7 +89,7 @@ def calculate_structure_score(text: str) -> float:
     
     # Check for bullet points or numbered lists
     list_items = sum(1 for line in non_empty_lines 
-                    if re.match(r'^\s*[-*•]\s+', line) or re.match(r'^\s*\d+\.', line))
+                    if _LIST_ITEM_RE.match(line))
     
     # Basic scoring
     score = 3.0  # Base score
@@ -96,16 +106,25 @@ def calculate_structure_score(text: str) -> float:
     return min(5.0, score)
 
 def analyze_heuristics(clinical_note: str) -> Dict[str, float]:
-    """Analyze clinical note using rule-based heuristics."""
-    results = {
+    """Analyze clinical note using rule-based heuristics (memoized by note content)."""
+    key = hashlib.blake2b(clinical_note.encode(), digest_size=16).digest()
+    with _HEURISTICS_CACHE_LOCK:
+        cached = _HEURISTICS_CACHE.get(key)
+    if cached is None:
+        cached = _analyze_heuristics_uncached(clinical_note)
+        with _HEURISTICS_CACHE_LOCK:
+            _HEURISTICS_CACHE[key] = cached
+    logger.info("Heuristic analysis completed.")
+    return dict(cached)
+
+def _analyze_heuristics_uncached(clinical_note: str) -> Dict[str, float]:
+    return {
         'length_score': calculate_length_score(clinical_note),
         'redundancy_score': calculate_redundancy_score(clinical_note),
         'structure_score': calculate_structure_score(clinical_note),
         'word_count': len(clinical_note.split()),
         'character_count': len(clinical_note)
     }
-    logger.info("Heuristic analysis completed.")
-    return results
 
 def get_heuristic_composite(heuristics: Dict[str, float]) -> float:
     """Calculate composite heuristic score (0-5)."""
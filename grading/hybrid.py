@@ -3,6 +3,9 @@ from .o3_judge import score_with_o3
 from .heuristics import analyze_heuristics, get_heuristic_composite
 from .factuality import analyze_factuality, analyze_factuality_with_agent
 import asyncio
+import bisect
+import math
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
 import logging
 import warnings
@@ -15,18 +18,15 @@ warnings.warn(
 
 logger = logging.getLogger(__name__)
 
+# Lower bound of each grade above F; a score equal to a cut belongs to the higher grade
+_GRADE_CUTS = (1.5, 2.5, 3.5, 4.5)
+_GRADES = ("F", "D", "C", "B", "A")
+
 def calculate_overall_grade(score: float) -> str:
     """Convert numeric score to letter grade."""
-    if score >= 4.5:
-        return "A"
-    elif score >= 3.5:
-        return "B"
-    elif score >= 2.5:
-        return "C"
-    elif score >= 1.5:
-        return "D"
-    else:
-        return "F"
+    if math.isnan(score):  # bisect would place NaN in the top bucket
+        return _GRADES[0]
+    return _GRADES[bisect.bisect_right(_GRADE_CUTS, score)]
 
 def grade_note_hybrid(clinical_note: str, encounter_transcript: str = "", model_precision: str = "medium") -> Dict[str, Any]:
     """
@@ -42,15 +42,49 @@ def grade_note_hybrid(clinical_note: str, encounter_transcript: str = "", model_
     
     # Strategy: Use Nine Rings architecture if explicitly enabled via env var; otherwise default to O3
     use_nine_rings = bool(Config.__dict__.get("USE_NINE_RINGS") or False)
-    if use_nine_rings:
-        try:
-            from .nine_rings import score_with_nine_rings  # Local import to avoid circular deps
-            pdqi_scores = score_with_nine_rings(clinical_note)
-        except Exception as e:
-            logger.error(f"NineRings evaluation failed, falling back to O3: {e}")
-            pdqi_scores = score_with_o3(clinical_note)
-    else:
-        pdqi_scores = score_with_o3(clinical_note)
+
+    def _score_pdqi() -> Dict[str, Any]:
+        if use_nine_rings:
+            try:
+                from .nine_rings import score_with_nine_rings  # Local import to avoid circular deps
+                return score_with_nine_rings(clinical_note)
+            except Exception as e:
+                logger.error(f"NineRings evaluation failed, falling back to O3: {e}")
+        return score_with_o3(clinical_note)
+
+    # --- Factuality: Use agent-based if transcript and GPT-4o config, else fallback ---
+    def _assess_factuality() -> Dict[str, Any]:
+        if encounter_transcript.strip() and hasattr(Config, 'AZURE_OPENAI_KEY') and hasattr(Config, 'AZURE_OPENAI_ENDPOINT') and hasattr(Config, 'AZURE_GPT4O_API_VERSION') and hasattr(Config, 'GPT4O_DEPLOYMENT'):
+            try:
+                return asyncio.run(
+                    analyze_factuality_with_agent(
+                        clinical_note,
+                        encounter_transcript,
+                        api_key=Config.AZURE_OPENAI_KEY,
+                        azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
+                        api_version=Config.AZURE_GPT4O_API_VERSION,
+                        model_name=Config.GPT4O_DEPLOYMENT
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Agent-based factuality failed, falling back to O3: {e}")
+        return analyze_factuality(clinical_note, encounter_transcript)
+
+    # The three components are independent until the weighted sum, so overlap the
+    # O3 / factuality round-trips with the local heuristic pass. The pool is shut down
+    # without joining, so a PDQI failure surfaces immediately instead of waiting on the
+    # factuality round-trip.
+    executor = ThreadPoolExecutor(max_workers=3)
+    try:
+        pdqi_future = executor.submit(_score_pdqi)
+        heuristics_future = executor.submit(analyze_heuristics, clinical_note)
+        factuality_future = executor.submit(_assess_factuality)
+        pdqi_scores = pdqi_future.result()
+        heuristics = heuristics_future.result()
+        factuality_analysis_result = factuality_future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
     # Cast any numeric strings like "4" or "4.0" to float for consistency
     for key, val in list(pdqi_scores.items()):
         if key != 'summary' and isinstance(val, str):
@@ -80,29 +114,7 @@ def grade_note_hybrid(clinical_note: str, encounter_transcript: str = "", model_
     if not isinstance(pdqi_scores.get('summary'), str) or not pdqi_scores.get('summary').strip():
         pdqi_scores['summary'] = _generate_pdqi_summary(pdqi_scores)
     
-    # Get heuristic analysis
-    heuristics = analyze_heuristics(clinical_note)
     heuristic_score = get_heuristic_composite(heuristics)
-    
-    # --- Factuality: Use agent-based if transcript and GPT-4o config, else fallback ---
-    factuality_analysis_result = None
-    if encounter_transcript.strip() and hasattr(Config, 'AZURE_OPENAI_KEY') and hasattr(Config, 'AZURE_OPENAI_ENDPOINT') and hasattr(Config, 'AZURE_GPT4O_API_VERSION') and hasattr(Config, 'GPT4O_DEPLOYMENT'):
-        try:
-            factuality_analysis_result = asyncio.run(
-                analyze_factuality_with_agent(
-                    clinical_note,
-                    encounter_transcript,
-                    api_key=Config.AZURE_OPENAI_KEY,
-                    azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-                    api_version=Config.AZURE_GPT4O_API_VERSION,
-                    model_name=Config.GPT4O_DEPLOYMENT
-                )
-            )
-        except Exception as e:
-            logger.error(f"Agent-based factuality failed, falling back to O3: {e}")
-            factuality_analysis_result = analyze_factuality(clinical_note, encounter_transcript)
-    else:
-        factuality_analysis_result = analyze_factuality(clinical_note, encounter_transcript)
     factuality_score = factuality_analysis_result['consistency_score']
     
     # --- Build chain of thought for debugging/review purposes ---
@@ -125,14 +137,15 @@ def grade_note_hybrid(clinical_note: str, encounter_transcript: str = "", model_
 
     # Calculate weighted hybrid score using PDQI total sum (normalized to 1-5 scale)
     pdqi_normalized = pdqi_total / 9.0  # Convert 9-45 scale to 1-5 scale
+    pdqi_weight, heuristic_weight, factuality_weight = Config.PDQI_WEIGHT, Config.HEURISTIC_WEIGHT, Config.FACTUALITY_WEIGHT
     hybrid_score = (
-        pdqi_normalized * Config.PDQI_WEIGHT +
-        heuristic_score * Config.HEURISTIC_WEIGHT +
-        factuality_score * Config.FACTUALITY_WEIGHT
+        pdqi_normalized * pdqi_weight +
+        heuristic_score * heuristic_weight +
+        factuality_score * factuality_weight
     )
     
     # Add scoring methodology explanation to chain of thought
-    scoring_explanation = f"\nScoring Methodology:\nPDQI Sum ({Config.PDQI_WEIGHT}) × {pdqi_total:.0f}/45→{pdqi_normalized:.2f} + Heuristic ({Config.HEURISTIC_WEIGHT}) × {heuristic_score:.2f} + Factuality ({Config.FACTUALITY_WEIGHT}) × {factuality_score:.2f} = {hybrid_score:.2f}"
+    scoring_explanation = f"\nScoring Methodology:\nPDQI Sum ({pdqi_weight}) × {pdqi_total:.0f}/45→{pdqi_normalized:.2f} + Heuristic ({heuristic_weight}) × {heuristic_score:.2f} + Factuality ({factuality_weight}) × {factuality_score:.2f} = {hybrid_score:.2f}"
     if chain_of_thought:
         chain_of_thought += scoring_explanation
     else:
@@ -162,9 +175,9 @@ def grade_note_hybrid(clinical_note: str, encounter_transcript: str = "", model_
         'hybrid_score': round(hybrid_score, 2),
         'overall_grade': calculate_overall_grade(hybrid_score),
         'weights_used': {
-            'pdqi_weight': Config.PDQI_WEIGHT,
-            'heuristic_weight': Config.HEURISTIC_WEIGHT,
-            'factuality_weight': Config.FACTUALITY_WEIGHT
+            'pdqi_weight': pdqi_weight,
+            'heuristic_weight': heuristic_weight,
+            'factuality_weight': factuality_weight
         },
         'chain_of_thought': chain_of_thought
     }
@@ -1,56 +1,301 @@
+import json
 import warnings
-warnings.warn(
-    "'grading.o3_judge' is deprecated; use 'clinical_note_quality.services.pdqi_service' instead.",
-    DeprecationWarning,
-    stacklevel=2,
-)
-from openai import AzureOpenAI, APIConnectionError, AuthenticationError, APIStatusError, RateLimitError, APIError
+from openai import AsyncAzureOpenAI, APIConnectionError, AuthenticationError, APIStatusError, RateLimitError, APIError, BadRequestError, NotFoundError
 from openai.types.chat import ChatCompletionMessageParam
 from openai.types import Reasoning
 from openai.types.responses import Response, ResponseReasoningItem, ResponseOutputRefusal
 try:
-    from jsonschema import validate, ValidationError
-except ModuleNotFoundError:
-    validate = None
-    ValidationError = Exception
-import json
+    import orjson
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ModuleNotFoundError:  # pragma: no cover
+    _loads = json.loads
+try:
+    import tiktoken
+except ModuleNotFoundError:  # pragma: no cover
+    tiktoken = None
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, List, Tuple
+import random
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Tuple, ClassVar, Optional
+from cachetools import TTLCache
+from clinical_note_quality.adapters.azure.http import build_async_http_client
 from config import Config
 from grading.exceptions import OpenAIServiceError, OpenAIAuthError, OpenAIResponseError
 
 logger = logging.getLogger(__name__)
 
+_PDQI_KEYS = (
+    'up_to_date', 'accurate', 'thorough', 'useful',
+    'organized', 'concise', 'consistent', 'complete', 'actionable'
+)
+_PDQI_KEYS_SET = frozenset(_PDQI_KEYS)
+
+_BACKOFF_CAP = 4.0  # seconds
+
+# Appended to the system prompt when several notes are scored in one completion
+_BATCH_INSTRUCTIONS = (
+    "\n\nBATCH MODE: The user message contains {count} numbered clinical notes. Score each note "
+    "independently and return ONLY a JSON object of the form {{\"results\": [...]}}, where "
+    "\"results\" holds exactly {count} objects in the same order as the notes, each in the JSON "
+    "format described above."
+)
+_MAX_BATCH_COMPLETION_TOKENS = 100000
+
+# Last-resort extraction of integer scores from malformed/truncated JSON
+_FALLBACK_RE = re.compile(r'"(' + '|'.join(_PDQI_KEYS) + r')"\s*:\s*([1-5])')
+
+# Exact-match cache of validated PDQI scores keyed by (note digest, deployment, precision).
+# Prompts come from Config class constants, so they cannot change within a process.
+_PDQI_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_PDQI_CACHE_LOCK = threading.Lock()
+
+
+def _pdqi_cache_key(clinical_note: str, model_precision: str) -> Tuple[str, str, str]:
+    digest = hashlib.blake2b(clinical_note.encode(), digest_size=16).hexdigest()
+    return digest, _deployment_for(model_precision), model_precision
+
+
+@functools.lru_cache(maxsize=1)
+def _get_azure_config() -> Tuple[str, str, str]:
+    """Read and validate Azure credentials once; returns (endpoint, key, api_version).
+
+    Call ``_get_azure_config.cache_clear()`` after reloading configuration.
+    """
+    if not Config.AZURE_OPENAI_ENDPOINT or not Config.AZURE_OPENAI_KEY:
+        raise ValueError("Azure OpenAI credentials not configured")
+    return Config.AZURE_OPENAI_ENDPOINT, Config.AZURE_OPENAI_KEY, Config.AZURE_O3_API_VERSION
+
+
+@functools.lru_cache(maxsize=1)
+def _deployments() -> Dict[str, str]:
+    """Map model_precision to its O3 deployment (HIGH/LOW default to the base deployment)."""
+    return {
+        "high": Config.AZURE_O3_HIGH_DEPLOYMENT,
+        "low": Config.AZURE_O3_LOW_DEPLOYMENT,
+        "medium": Config.AZURE_O3_DEPLOYMENT,
+    }
+
+
+def _deployment_for(model_precision: str) -> str:
+    deployments = _deployments()
+    return deployments.get(model_precision, deployments["medium"])
+
+
+@functools.lru_cache(maxsize=1)
+def _note_encoder():
+    """Return the tokenizer used for note budgeting (gpt-4o's is the closest proxy for o3)."""
+    return tiktoken.encoding_for_model("gpt-4o")
+
+
+def _estimate_tokens(text: str) -> int:
+    if tiktoken is None:
+        return len(text) // 4 + 1
+    return len(_note_encoder().encode(text))
+
+
+def _fit_note_to_budget(clinical_note: str) -> str:
+    """Truncate *clinical_note* to ``Config.MAX_NOTE_TOKENS`` tokens.
+
+    Without tiktoken the budget is approximated at four characters per token.
+    """
+    max_tokens = Config.MAX_NOTE_TOKENS
+    if tiktoken is None:
+        max_chars = max_tokens * 4
+        if len(clinical_note) <= max_chars:
+            return clinical_note
+        logger.warning(f"Clinical note of {len(clinical_note)} chars exceeds ~{max_tokens} token budget; truncating")
+        return clinical_note[:max_chars]
+
+    encoder = _note_encoder()
+    tokens = encoder.encode(clinical_note)
+    if len(tokens) <= max_tokens:
+        return clinical_note
+    logger.warning(f"Clinical note of {len(tokens)} tokens exceeds {max_tokens} token budget; truncating")
+    return encoder.decode(tokens[:max_tokens])
+
+
+def _service_error_for(e: Exception) -> OpenAIServiceError:
+    """Log *e* and translate it into the grading package's exception hierarchy."""
+    if isinstance(e, ValueError):
+        # Catch validation errors raised above (should be less likely now)
+        logger.error(f"ValueError during O3 response processing. Error: {e}", exc_info=True)
+        return OpenAIResponseError(str(e))
+    if isinstance(e, AuthenticationError):
+        logger.error(f"Azure OpenAI authentication failed: {e}", exc_info=True)
+        return OpenAIAuthError("Authentication failed. Please check your Azure OpenAI credentials.")
+    if isinstance(e, APIConnectionError):
+        logger.error(f"Could not connect to Azure OpenAI service: {e}", exc_info=True)
+        return OpenAIServiceError("Could not connect to Azure OpenAI service.")
+    if isinstance(e, RateLimitError):
+        logger.error(f"Azure OpenAI rate limit exceeded: {e}", exc_info=True)
+        return OpenAIServiceError("Rate limit exceeded for Azure OpenAI service.")
+    if isinstance(e, APIStatusError):
+        logger.error(f"Azure OpenAI API error. Status: {e.status_code}, Message: {e.message}", exc_info=True)
+        return OpenAIServiceError(f"Azure OpenAI API error: {e.status_code} {e.message}")
+    if isinstance(e, APIError):
+        logger.error(f"Azure OpenAI SDK error: {e}", exc_info=True)
+        return OpenAIServiceError(f"Azure OpenAI SDK error: {e}")
+    logger.error(f"Unexpected error in PDQI scoring: {e}", exc_info=True)
+    return OpenAIServiceError(f"Unexpected error in PDQI scoring: {e}")
+
+
+def _debug_raw_content(content: str) -> None:
+    """Log a truncated copy of a raw model response; full responses can run to many KB."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("O3 raw content (len=%d): %.200s", len(content), content)
+
+
+def _retry_after_seconds(value: str) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date; None if unparseable."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:  # "-0000" dates parse as naive UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+def _backoff_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """Jittered exponential back-off (capped at 4s), honouring Retry-After on rate limits.
+
+    Retry-After is clamped to the same cap so a server cannot stall a request thread indefinitely.
+    """
+    if isinstance(error, RateLimitError):
+        header = error.response.headers.get("Retry-After")
+        retry_after = _retry_after_seconds(header) if header else None
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), _BACKOFF_CAP)
+    return min(0.25 * (2 ** attempt) * (0.5 + random.random()), _BACKOFF_CAP)
+
+
+def _extract_json_blob(text: str) -> Dict[str, Any] | None:
+    """Return the JSON object embedded in *text* (e.g. "Here is the JSON: {...}").
+
+    Slices from the first '{' to the last '}' in O(n) - the same span the old
+    greedy ``{.*}`` DOTALL regex matched, without the backtracking.
+    """
+    first = text.find('{')
+    last = text.rfind('}')
+    if first == -1 or last <= first:
+        return None
+    try:
+        return _loads(text[first:last + 1])
+    except json.JSONDecodeError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedOutput:
+    """A Responses-API output item reduced to its kind and text."""
+
+    kind: str
+    text: str
+
+
+def _extract_item_text(item: Any, *, unwrap_content: bool) -> str:
+    """Return the text of an output item from its ``content`` or ``text`` attribute."""
+    content = getattr(item, 'content', None)
+    if content is None:
+        text = getattr(item, 'text', None)
+        return "" if text is None else str(text)
+    if not unwrap_content or isinstance(content, str):
+        return str(content)
+    # Message content may be an object with .text or a list of such parts
+    if isinstance(content, list):
+        if not content:
+            return ""
+        content = content[0]
+        if isinstance(content, str):
+            return content
+    text = getattr(content, 'text', None)
+    return "" if text is None else str(text)
+
+
+def _parse_output_item(item: Any) -> _ParsedOutput:
+    """Classify a Responses-API output item as reasoning, message, or ignorable."""
+    match getattr(item, 'type', ""):
+        case "reasoning":
+            return _ParsedOutput("reasoning", _extract_item_text(item, unwrap_content=False))
+        case "message":
+            return _ParsedOutput("message", _extract_item_text(item, unwrap_content=True))
+        case _:
+            return _ParsedOutput("", "")
+
+
 class O3Judge:
+    # Result of the first Responses-API probe in this process (None = not probed yet).
+    _responses_api_supported: ClassVar[Optional[bool]] = None
+    _capability_lock: ClassVar[threading.Lock] = threading.Lock()
+    _warned: ClassVar[bool] = False
+
     def __init__(self):
-        if not Config.AZURE_OPENAI_ENDPOINT or not Config.AZURE_OPENAI_KEY:
-            raise ValueError("Azure OpenAI credentials not configured")
-        self.client = AzureOpenAI(
-            azure_endpoint=Config.AZURE_OPENAI_ENDPOINT,
-            api_key=Config.AZURE_OPENAI_KEY,
-            api_version=Config.AZURE_O3_API_VERSION  # Use O3 API version
+        # Warn on first use rather than at import time (pdqi_service imports this module).
+        if not O3Judge._warned:
+            O3Judge._warned = True
+            warnings.warn(
+                "'grading.o3_judge' is deprecated; use 'clinical_note_quality.services.pdqi_service' instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        # Snapshot per-call Config reads; precision prompts are built once rather than
+        # re-concatenated onto the (multi-KB) base instructions on every request.
+        base_instructions = Config.PDQI_INSTRUCTIONS
+        self._precision_instructions = {
+            "low": (
+                base_instructions
+                + "\n\nMODE: FAST - Provide concise evaluations with essential rationale only. Focus on clear, decisive scoring."
+                + "\nOUTPUT FORMAT NOTE (FAST): Return only the nine PDQI fields, a short 'summary', and an optional 'scoring_rationale'. Omit 'dimension_explanations' to keep the response compact."
+            ),
+            "high": base_instructions + "\n\nMODE: THOROUGH - Provide comprehensive evaluations with detailed rationale, extensive evidence excerpts, and nuanced analysis. Take extra time to consider edge cases and provide thorough improvement suggestions.",
+            "medium": base_instructions + "\n\nMODE: BALANCED - Provide well-reasoned evaluations with good balance of detail and efficiency.",
+        }
+        self._max_tokens = getattr(Config, 'MAX_COMPLETION_TOKENS', None)
+        self._responses_api_disabled = bool(getattr(Config, 'DISABLE_RESPONSES_API', False))
+
+        endpoint, api_key, api_version = _get_azure_config()
+        self.client = AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            api_key=api_key,
+            api_version=api_version,  # Use O3 API version
+            # Shared pool policy (keep-alive, HTTP/2 when available) used by every Azure client
+            http_client=build_async_http_client(),
         )
 
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client."""
+        await self.client.close()
+
     def _parse_json_lenient(self, raw: str) -> Dict[str, Any]:
         """Attempt to parse possibly-truncated JSON by trimming and fixing common issues.
 
+        Called after a strict parse of *raw* has already failed.
+
         Strategy:
-        - First try strict json.loads
         - Iteratively trim to earlier closing braces and try to parse
         - If a long block like dimension_explanations is truncated, drop it and close the object
         """
-        try:
-            return json.loads(raw)
-        except Exception:
-            pass
-
-        # Try progressively trimming to the last closing brace
+        # Try progressively trimming to the last closing brace, skipping the
+        # candidate that would equal the already-rejected full string
         end = raw.rfind('}')
+        if end == len(raw) - 1:
+            end = raw.rfind('}', 0, end)
         attempts = 0
         while end != -1 and attempts < 25:
             candidate = raw[:end + 1]
             try:
-                return json.loads(candidate)
+                return _loads(candidate)
             except Exception:
                 end = raw.rfind('}', 0, end)
                 attempts += 1
@@ -69,7 +314,7 @@ class O3Judge:
             if not candidate.endswith('}'):
                 candidate = candidate + "\n}"
             try:
-                return json.loads(candidate)
+                return _loads(candidate)
             except Exception:
                 pass
 
@@ -101,176 +346,242 @@ class O3Judge:
         
         return reasoning_summary
 
-    def _make_pdqi_request(self, kwargs: dict, reasoning_enabled: bool) -> Tuple[str, str]:
-        """Make PDQI request with retry logic and reasoning extraction."""
+    async def _stream_content(self, kwargs: Dict[str, Any]) -> str:
+        """Run a streaming chat completion and return the concatenated message content."""
+        stream = await self.client.chat.completions.create(**kwargs, stream=True)
+        parts: List[str] = []
+        async for chunk in stream:
+            # Azure may send chunks with no choices (e.g. content-filter annotations)
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    async def _make_pdqi_request(self, kwargs: dict, reasoning_enabled: bool) -> Tuple[str, str]:
+        """Make PDQI request with retry logic and reasoning extraction.
+
+        Consumes *kwargs*: the unsupported ``reasoning`` key is popped in place.
+        """
         content = ""
         reasoning_summary = ""
         
         # Remove reasoning parameter if it exists to avoid errors
-        kwargs_safe = kwargs.copy()
-        kwargs_safe.pop('reasoning', None)
+        kwargs.pop('reasoning', None)
         
         for attempt in range(3):
             try:
-                response = self.client.chat.completions.create(**kwargs_safe)
-                
-                # Extract reasoning summary if enabled
-                reasoning_summary = self._extract_reasoning_summary(response, reasoning_enabled)
-                
-                # Extract main content
-                if response.choices and response.choices[0].message:
-                    content = response.choices[0].message.content or ""
-                    if content:
-                        logger.info(f"Successfully got PDQI response on attempt {attempt + 1}")
-                        break
+                if reasoning_enabled:
+                    response = await self.client.chat.completions.create(**kwargs)
+
+                    # Extract reasoning summary if enabled
+                    reasoning_summary = self._extract_reasoning_summary(response, reasoning_enabled)
+
+                    # Extract main content
+                    if response.choices and response.choices[0].message:
+                        content = response.choices[0].message.content or ""
                 else:
-                    logger.warning(f"Empty response on attempt {attempt + 1}")
+                    # Stream the completion so the body is consumed while the model is still
+                    # generating, and other notes can progress on the event loop meanwhile.
+                    content = await self._stream_content(kwargs)
+
+                if content:
+                    logger.info(f"Successfully got PDQI response on attempt {attempt + 1}")
+                    break
+                logger.warning(f"Empty response on attempt {attempt + 1}")
+                delay = _backoff_delay(attempt)
                     
             except Exception as e:
                 logger.warning(f"Request attempt {attempt + 1} failed: {e}")
                 if attempt == 2:  # Last attempt
                     raise
+                delay = _backoff_delay(attempt, e)
+
+            if attempt < 2:
+                await asyncio.sleep(delay)
         
         return content, reasoning_summary
 
-    def score_pdqi9(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
-        """Score clinical note using PDQI-9 dimensions with O3 model."""
-        # Check if responses API is disabled
-        if hasattr(Config, 'DISABLE_RESPONSES_API') and Config.DISABLE_RESPONSES_API:
-            logger.info("Responses API disabled, using chat.completions directly")
-            return self._score_with_chat_completions(clinical_note, model_precision)
-            
-        try:
-            # Try responses API first (newer, more advanced)
-            return self._score_with_responses_api(clinical_note, model_precision)
-        except Exception as e:
-            logger.warning(f"Responses API failed: {e}, falling back to chat.completions")
-            return self._score_with_chat_completions(clinical_note, model_precision)
+    async def score_pdqi9(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
+        """Score clinical note using PDQI-9 dimensions with O3 model.
+
+        Identical notes scored at the same precision are served from an in-process cache.
+        """
+        key = _pdqi_cache_key(clinical_note, model_precision)
+        with _PDQI_CACHE_LOCK:
+            cached = _PDQI_CACHE.get(key)
+        if cached is not None:
+            logger.info("PDQI cache hit for precision %s", model_precision)
+            return dict(cached)
+
+        scores = await self._score_pdqi9_uncached(_fit_note_to_budget(clinical_note), model_precision)
+        with _PDQI_CACHE_LOCK:
+            _PDQI_CACHE[key] = scores
+        return dict(scores)
+
+    async def score_pdqi9_batch(self, notes: List[str], model_precision: str = "medium") -> List[Dict[str, Any]]:
+        """Score several notes in a single chat completion; results are returned in input order.
+
+        Falls back to concurrent per-note requests (`score_batch`) for a single note or
+        when the notes together exceed ``Config.MAX_NOTE_TOKENS``.
+        """
+        if len(notes) <= 1 or sum(_estimate_tokens(note) for note in notes) > Config.MAX_NOTE_TOKENS:
+            return await self.score_batch(notes, model_precision)
 
-    def _score_with_responses_api(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
-        """Try scoring with the newer responses API (beta)."""
         try:
-            # Import responses API
-            from openai import AzureOpenAI
-            
-            # Use single deployment but vary parameters based on precision
-            model_name = Config.AZURE_O3_DEPLOYMENT
-            logger.info(f"Using O3 responses API with precision: {model_precision}, deployment: {model_name}")
-            
-            # Prepare messages with precision-based instructions
-            system_content = self._get_precision_instructions(model_precision)
-            messages = [
+            model_name = _deployment_for(model_precision)
+            logger.info("Using O3 batched chat completions for %d notes with precision: %s, deployment: %s", len(notes), model_precision, model_name)
+
+            system_content = self._get_precision_instructions(model_precision) + _BATCH_INSTRUCTIONS.format(count=len(notes))
+            user_content = "\n\n".join(f"{i}. Clinical Note:\n\n{note}" for i, note in enumerate(notes, 1))
+            messages: List[ChatCompletionMessageParam] = [
                 {"role": "system", "content": system_content},
-                {"role": "user", "content": f"Clinical Note:\n\n{clinical_note}"}
+                {"role": "user", "content": user_content}
             ]
-            
-            # Create response with reasoning enabled - cast client to Any for beta API access
-            client_any: Any = self.client
-            response = client_any.beta.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                max_completion_tokens=getattr(Config, 'MAX_COMPLETION_TOKENS', 4000),
-                response_format={"type": "json_object"}
-            )
-            
-            # Extract content and reasoning from response
-            response_content = ""
-            reasoning_content = ""
-            
-            # Handle response structure safely using getattr
-            if hasattr(response, 'output') and response.output:
-                for output_item in response.output:
-                    # Cast to Any to avoid type checker issues
-                    item: Any = output_item
-                    
-                    # Check if this is reasoning content
-                    if getattr(item, 'type', None) == "reasoning":
-                        # Safe access to reasoning content - try multiple possible attributes
-                        content_attr = getattr(item, 'content', None)
-                        text_attr = getattr(item, 'text', None)
-                        
-                        if content_attr is not None:
-                            reasoning_content = str(content_attr)
-                            logger.info(f"Responses API: Extracted reasoning content ({len(reasoning_content)} chars)")
-                        elif text_attr is not None:
-                            reasoning_content = str(text_attr)
-                            logger.info(f"Responses API: Extracted reasoning content ({len(reasoning_content)} chars)")
-                    
-                    # Check if this is the main response content
-                    elif getattr(item, 'type', None) == "message":
-                        # Safe access to message content - handle various response structures
-                        content_attr = getattr(item, 'content', None)
-                        text_attr = getattr(item, 'text', None)
-                        
-                        if content_attr is not None:
-                            # Could be string or object with text attribute
-                            if isinstance(content_attr, str):
-                                response_content = str(content_attr)
-                            elif hasattr(content_attr, 'text'):
-                                response_content = str(getattr(content_attr, 'text', ''))
-                            elif isinstance(content_attr, list) and len(content_attr) > 0:
-                                # Handle list of content items
-                                first_item = content_attr[0]
-                                if hasattr(first_item, 'text'):
-                                    response_content = str(getattr(first_item, 'text', ''))
-                                elif isinstance(first_item, str):
-                                    response_content = str(first_item)
-                        elif text_attr is not None:
-                            response_content = str(text_attr)
-                        
-                        if response_content:
-                            logger.info(f"Responses API: Extracted response content ({len(response_content)} chars)")
-            
-            # Validate we got content
-            if not response_content:
-                logger.warning("Responses API: No response content found, checking alternative structure")
-                # Fallback: try to access response differently using proper attributes
-                response_any: Any = response
-                if hasattr(response_any, 'output_text'):
-                    response_content = str(getattr(response_any, 'output_text', ''))
-                elif hasattr(response_any, 'text'):
-                    response_content = str(getattr(response_any, 'text', ''))
-            
-            if response_content:
-                # Parse JSON from response content
-                import re
-                json_match = re.search(r'\{.*\}', response_content, re.DOTALL)
-                if json_match:
-                    json_content = json_match.group(0)
-                    scores = json.loads(json_content)
-                    
-                    # Add reasoning summary to scores if available
-                    if reasoning_content:
-                        scores["reasoning_summary"] = reasoning_content
-                        logger.info(f"Responses API: Successfully extracted reasoning summary ({len(reasoning_content)} characters)")
-                    
-                    logger.info("Responses API: Successfully parsed PDQI scores with reasoning")
-                    return scores
-                else:
-                    logger.warning("Responses API: Could not extract JSON from response content")
-            
-            # If we get here, responses API didn't work as expected
-            logger.warning("Responses API: Didn't return expected format, falling back to chat.completions")
-            return self._score_with_chat_completions(clinical_note, model_precision)
-            
+            kwargs = self._build_precision_kwargs(model_name, messages, model_precision)
+            if "max_completion_tokens" in kwargs:
+                kwargs["max_completion_tokens"] = min(kwargs["max_completion_tokens"] * len(notes), _MAX_BATCH_COMPLETION_TOKENS)
+
+            content, _ = await self._make_pdqi_request(kwargs, reasoning_enabled=False)
+            if not content:
+                logger.error("Empty batched response content after retries")
+                raise OpenAIResponseError("Empty response from Azure OpenAI service for batched PDQI-9 check")
+
+            parsed = _loads(content)
+            results = parsed.get("results") if isinstance(parsed, dict) else None
+            if not isinstance(results, list) or len(results) != len(notes):
+                logger.error("Batched O3 response did not contain %d results", len(notes))
+                _debug_raw_content(content)
+                raise OpenAIResponseError(f"Invalid or malformed response from Azure OpenAI service: expected {len(notes)} results.")
+
+            if not all(isinstance(scores, dict) for scores in results):
+                logger.error("Batched O3 response contained a non-object result entry")
+                _debug_raw_content(content)
+                raise OpenAIResponseError("Invalid or malformed response from Azure OpenAI service: every batched result must be an object.")
+
+            return [self._validate_scores(scores, content) for scores in results]
+
+        except OpenAIResponseError:
+            raise
         except Exception as e:
-            logger.warning(f"Responses API failed: {e}, falling back to chat.completions")
-            return self._score_with_chat_completions(clinical_note, model_precision)
+            raise _service_error_for(e)
+
+    async def _score_pdqi9_uncached(self, clinical_note: str, model_precision: str) -> Dict[str, Any]:
+        """Pick the Responses API or chat.completions path and score the note."""
+        # Check if responses API is disabled, or a previous probe showed it is unsupported
+        if self._responses_api_disabled:
+            logger.info("Responses API disabled, using chat.completions directly")
+            return await self._score_with_chat_completions(clinical_note, model_precision)
+        if O3Judge._responses_api_supported is False:
+            return await self._score_with_chat_completions(clinical_note, model_precision)
 
-    def _score_with_chat_completions(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
+        try:
+            # Try responses API first (newer, more advanced)
+            scores = await self._score_with_responses_api(clinical_note, model_precision)
+        except (AttributeError, NotFoundError, BadRequestError) as e:
+            # Missing SDK surface or a deployment that rejects the call: genuinely unsupported
+            logger.warning(f"Responses API unsupported: {e}, disabling it for this process and falling back to chat.completions")
+            with O3Judge._capability_lock:
+                O3Judge._responses_api_supported = False
+            return await self._score_with_chat_completions(clinical_note, model_precision)
+        except Exception as e:
+            # Transient, server, auth or payload-validation failure - says nothing about API
+            # support, so fall back for this call only and probe again next time
+            logger.warning(f"Responses API failed: {e}, falling back to chat.completions for this call")
+            return await self._score_with_chat_completions(clinical_note, model_precision)
+
+        with O3Judge._capability_lock:
+            O3Judge._responses_api_supported = True
+        return scores
+
+    async def score_batch(self, notes: List[str], model_precision: str = "medium") -> List[Dict[str, Any]]:
+        """Score several notes concurrently; results are returned in input order."""
+        return await asyncio.gather(*(self.score_pdqi9(note, model_precision) for note in notes))
+
+    async def score_all_precisions(self, clinical_note: str) -> Dict[str, Dict[str, Any]]:
+        """Score one note against the low/medium/high deployments concurrently."""
+        low, medium, high = await asyncio.gather(
+            self.score_pdqi9(clinical_note, "low"),
+            self.score_pdqi9(clinical_note, "medium"),
+            self.score_pdqi9(clinical_note, "high"),
+        )
+        return {"low": low, "medium": medium, "high": high}
+
+    async def _score_with_responses_api(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
+        """Try scoring with the newer responses API (beta).
+
+        Raises on any failure so that `score_pdqi9` can fall back to chat.completions
+        and remember whether the deployment supports this API.
+        """
+        # Select deployment based on model_precision
+        model_name = _deployment_for(model_precision)
+        logger.info("Using O3 responses API with precision: %s, deployment: %s", model_precision, model_name)
+        
+        # Prepare messages with precision-based instructions
+        system_content = self._get_precision_instructions(model_precision)
+        messages = [
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": f"Clinical Note:\n\n{clinical_note}"}
+        ]
+        
+        # Create response with reasoning enabled - cast client to Any for beta API access
+        client_any: Any = self.client
+        response = await client_any.beta.chat.completions.create(
+            model=model_name,
+            messages=messages,
+            max_completion_tokens=getattr(Config, 'MAX_COMPLETION_TOKENS', 4000),
+            response_format={"type": "json_object"}
+        )
+        
+        # Extract content and reasoning from response
+        response_content = ""
+        reasoning_content = ""
+        
+        # Single pass over typed output items; the last non-empty item of each kind wins
+        for parsed in [_parse_output_item(item) for item in (getattr(response, 'output', None) or ())]:
+            if not parsed.text:
+                continue
+            if parsed.kind == "reasoning":
+                reasoning_content = parsed.text
+            elif parsed.kind == "message":
+                response_content = parsed.text
+        if reasoning_content:
+            logger.info(f"Responses API: Extracted reasoning content ({len(reasoning_content)} chars)")
+        if response_content:
+            logger.info(f"Responses API: Extracted response content ({len(response_content)} chars)")
+
+        # Validate we got content
+        if not response_content:
+            logger.warning("Responses API: No response content found, checking alternative structure")
+            # Fallback: try to access response differently using proper attributes
+            response_any: Any = response
+            if hasattr(response_any, 'output_text'):
+                response_content = str(getattr(response_any, 'output_text', ''))
+            elif hasattr(response_any, 'text'):
+                response_content = str(getattr(response_any, 'text', ''))
+        
+        if response_content:
+            # Parse JSON from response content
+            scores = _extract_json_blob(response_content)
+            if scores is not None:
+                # Add reasoning summary to scores if available
+                if reasoning_content:
+                    scores["reasoning_summary"] = reasoning_content
+                    logger.info(f"Responses API: Successfully extracted reasoning summary ({len(reasoning_content)} characters)")
+                
+                logger.info("Responses API: Successfully parsed PDQI scores with reasoning")
+                # Same checks as the chat.completions path, so only validated scores are cached
+                return self._validate_scores(scores, response_content)
+            else:
+                logger.warning("Responses API: Could not extract JSON from response content")
+        
+        # If we get here, responses API didn't work as expected
+        raise OpenAIResponseError("Responses API did not return the expected format")
+
+    async def _score_with_chat_completions(self, clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
         """Original chat.completions.create() implementation."""
         try:
-            from openai import AuthenticationError, APIConnectionError, RateLimitError, APIStatusError, APIError
-            from jsonschema import ValidationError, validate
-            
-            messages: List[ChatCompletionMessageParam] = [
-                {"role": "system", "content": Config.PDQI_INSTRUCTIONS},
-                {"role": "user", "content": f"Clinical Note:\n\n{clinical_note}"}
-            ]
-            
             # Select deployment based on model_precision
-            model_name = Config.AZURE_O3_DEPLOYMENT
-            logger.info(f"Using O3 chat completions with precision: {model_precision}, deployment: {model_name}")
+            model_name = _deployment_for(model_precision)
+            logger.info("Using O3 chat completions with precision: %s, deployment: %s", model_precision, model_name)
             
             # Prepare messages with precision-based instructions
             system_content = self._get_precision_instructions(model_precision)
@@ -285,15 +596,18 @@ class O3Judge:
             # Try to enable reasoning parameter for chain of thought summaries
             reasoning_enabled = self._try_enable_reasoning(kwargs)
             
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("O3Judge: sending PDQI-9 request", extra={"model": model_name, "note_chars": len(clinical_note)})
+
             # Make request with retry logic
-            content, reasoning_summary = self._make_pdqi_request(kwargs, reasoning_enabled)
+            content, reasoning_summary = await self._make_pdqi_request(kwargs, reasoning_enabled)
             if not content:
                 logger.error("Empty response content after retries")
                 raise OpenAIResponseError("Empty response from Azure OpenAI service for PDQI-9 check")
 
             # Try to parse JSON response, log and raise detailed error if it fails
             try:
-                scores = json.loads(content)
+                scores = _loads(content)
             except json.JSONDecodeError as e:
                 # Attempt lenient parsing/repair
                 try:
@@ -301,148 +615,19 @@ class O3Judge:
                     logger.warning("Leniently repaired JSON from O3 response due to error: %s", e)
                 except Exception:
                     # As a last resort, extract integer scores via regex even if summary is truncated.
-                    import re
-                    pattern = r'"(up_to_date|accurate|thorough|useful|organized|concise|consistent|complete|actionable)"\s*:\s*([1-5])'
-                    matches = re.findall(pattern, content)
+                    matches = _FALLBACK_RE.findall(content)
                     if matches:
                         logger.warning("Parsed %d PDQI scores via regex fallback due to malformed JSON.", len(matches))
                         scores = {k: int(v) for k, v in matches}
                         # Fill any missing keys with score 3 as neutral default
-                        required_keys = [
-                            'up_to_date', 'accurate', 'thorough', 'useful', 
-                            'organized', 'concise', 'consistent', 'complete', 'actionable'
-                        ]
-                        for missing in [k for k in required_keys if k not in scores]:
+                        for missing in _PDQI_KEYS_SET.difference(scores):
                             scores[missing] = 3
                     else:
-                        logger.error(f"Failed to parse O3 JSON response: {content}. Error: {e}", exc_info=True)
+                        logger.error("Failed to parse O3 JSON response: %s", e, exc_info=True)
+                        _debug_raw_content(content)
                         raise OpenAIResponseError(f"Invalid or malformed response from Azure OpenAI service: {e}\nRaw content: {content}")
 
-            # Defensive programming: Ensure scores is not None
-            if scores is None:
-                logger.error("Parsed scores is None, creating fallback scores")
-                scores = {
-                    'up_to_date': 3, 'accurate': 3, 'thorough': 3, 'useful': 3,
-                    'organized': 3, 'concise': 3, 'consistent': 3, 'complete': 3, 'actionable': 3,
-                    'summary': 'Fallback scores due to parsing error'
-                }
-
-            required_keys = [
-                'up_to_date', 'accurate', 'thorough', 'useful', 
-                'organized', 'concise', 'consistent', 'complete', 'actionable'
-            ]
-
-            if not all(key in scores for key in required_keys):
-                logger.error(f"Missing required keys in O3 response: {content}", exc_info=True)
-                raise OpenAIResponseError("Invalid or malformed response from Azure OpenAI service: Missing keys.")
-
-            for key, value in scores.items():
-                # Only check keys that are supposed to be there, ignore extra keys if any
-                if key in required_keys and (not isinstance(value, int) or not 1 <= value <= 5):
-                    logger.error(f"Invalid score for {key}: {value} in O3 response: {content}", exc_info=True)
-                    raise OpenAIResponseError(f"Invalid or malformed response from Azure OpenAI service: Invalid score for {key}.")
-
-            # Validate enhanced dimension explanations if present
-            if 'dimension_explanations' in scores:
-                dimension_explanations = scores['dimension_explanations']
-                if isinstance(dimension_explanations, list):
-                    for i, explanation in enumerate(dimension_explanations):
-                        if not isinstance(explanation, dict):
-                            logger.warning(f"Dimension explanation {i} is not a dict, skipping validation")
-                            continue
-                        
-                        # Validate required fields in each explanation
-                        required_explanation_keys = ['dimension', 'score', 'narrative']
-                        missing_keys = [k for k in required_explanation_keys if k not in explanation]
-                        if missing_keys:
-                            logger.warning(f"Dimension explanation {i} missing keys: {missing_keys}")
-                        
-                        # Validate dimension name is valid
-                        if 'dimension' in explanation and explanation['dimension'] not in required_keys:
-                            logger.warning(f"Invalid dimension name in explanation {i}: {explanation['dimension']}")
-                        
-                        # Validate score consistency
-                        if ('dimension' in explanation and 'score' in explanation and 
-                            explanation['dimension'] in scores and 
-                            scores[explanation['dimension']] != explanation['score']):
-                            logger.warning(f"Score mismatch for {explanation['dimension']}: main={scores[explanation['dimension']]}, explanation={explanation['score']}")
-                    
-                    logger.info(f"Validated {len(dimension_explanations)} dimension explanations")
-                else:
-                    logger.warning("dimension_explanations is not a list, ignoring enhanced validation")
-
-            # Schema validation if available
-            try:
-                from jsonschema import validate, ValidationError
-                # Enhanced schema for full narrative response format
-                dimension_explanation_schema = {
-                    "type": "object",
-                    "properties": {
-                        "dimension": {"type": "string", "enum": required_keys},
-                        "score": {"type": "integer", "minimum": 1, "maximum": 5},
-                        "narrative": {"type": "string", "minLength": 1},
-                        "evidence_excerpts": {"type": "array", "items": {"type": "string"}},
-                        "improvement_suggestions": {"type": "array", "items": {"type": "string"}}
-                    },
-                    "required": ["dimension", "score", "narrative"],
-                    "additionalProperties": False
-                }
-                
-                PDQI_SCHEMA = {
-                    "type": "object",
-                    "properties": {
-                        **{k: {"type": "integer", "minimum": 1, "maximum": 5} for k in required_keys},
-                        "summary": {"type": "string", "minLength": 1},
-                        "scoring_rationale": {"type": "string"},
-                        "reasoning_summary": {"type": "string"},  # Allow reasoning summary
-                        "dimension_explanations": {
-                            "type": "array",
-                            "items": dimension_explanation_schema,
-                            "minItems": 0,
-                            "maxItems": 9
-                        },
-                        # Backward compatibility
-                        "rationale": {"type": "string"}
-                    },
-                    "required": required_keys,
-                    "additionalProperties": True  # Allow additional properties
-                }
-                
-                try:
-                    validate(instance=scores, schema=PDQI_SCHEMA)
-                except ValidationError as ve:
-                    # Fix: ValidationError doesn't have .message attribute in newer versions
-                    error_message = str(ve)
-                    logger.warning(f"PDQI schema validation failed: {error_message}. Attempting to coerce numeric strings.")
-                    
-                    # Create a new dictionary with proper typing for coerced values
-                    coerced_scores: Dict[str, int] = {}
-                    for k in required_keys:
-                        v = scores.get(k)
-                        if isinstance(v, str) and v.strip().replace('.', '', 1).isdigit():
-                            # Convert numeric strings to integers
-                            coerced_scores[k] = int(float(v))
-                        elif isinstance(v, float):
-                            # Convert floats to integers
-                            coerced_scores[k] = int(v)
-                        elif isinstance(v, int):
-                            # Keep integers as-is
-                            coerced_scores[k] = v
-                        else:
-                            # For any other type, set a default value of 3 for required keys
-                            logger.warning(f"Unexpected type for required key {k}: {type(v)}, using default value 3")
-                            coerced_scores[k] = 3
-                    
-                    # Update only the required keys with coerced values (all values are guaranteed to be int)
-                    for k, v in coerced_scores.items():
-                        # Explicit cast to ensure type checker knows this is an int
-                        scores[k] = int(v)  # type: ignore[assignment]
-                    
-                    # Re-validate; raise if still broken
-                    validate(instance=scores, schema=PDQI_SCHEMA)
-                    
-            except ImportError:
-                logger.info("jsonschema not available, skipping schema validation")
+            scores = self._validate_scores(scores, content)
 
             logger.info("O3 PDQI-9 scoring completed successfully.")
             
@@ -456,47 +641,82 @@ class O3Judge:
         except OpenAIResponseError:
             # Re-raise if it's already the correct type from checks above
             raise
-        except ValueError as e:
-            # Catch validation errors raised above (should be less likely now)
-            logger.error(f"ValueError during O3 response processing. Error: {e}", exc_info=True)
-            raise OpenAIResponseError(str(e))
-        except AuthenticationError as e:
-            logger.error(f"Azure OpenAI authentication failed: {e}", exc_info=True)
-            raise OpenAIAuthError("Authentication failed. Please check your Azure OpenAI credentials.")
-        except APIConnectionError as e:
-            logger.error(f"Could not connect to Azure OpenAI service: {e}", exc_info=True)
-            raise OpenAIServiceError("Could not connect to Azure OpenAI service.")
-        except RateLimitError as e:
-            logger.error(f"Azure OpenAI rate limit exceeded: {e}", exc_info=True)
-            raise OpenAIServiceError("Rate limit exceeded for Azure OpenAI service.")
-        except APIStatusError as e:
-            logger.error(f"Azure OpenAI API error. Status: {e.status_code}, Message: {e.message}", exc_info=True)
-            raise OpenAIServiceError(f"Azure OpenAI API error: {e.status_code} {e.message}")
-        except APIError as e:
-            logger.error(f"Azure OpenAI SDK error: {e}", exc_info=True)
-            raise OpenAIServiceError(f"Azure OpenAI SDK error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in PDQI scoring: {e}", exc_info=True)
-            raise OpenAIServiceError(f"Unexpected error in PDQI scoring: {e}")
+            raise _service_error_for(e)
+
+    def _validate_scores(self, scores: Optional[Dict[str, Any]], content: str) -> Dict[str, Any]:
+        """Validate one PDQI score object in place; *content* is the raw response for logging."""
+        # Defensive programming: Ensure scores is not None
+        if scores is None:
+            logger.error("Parsed scores is None, creating fallback scores")
+            scores = {
+                'up_to_date': 3, 'accurate': 3, 'thorough': 3, 'useful': 3,
+                'organized': 3, 'concise': 3, 'consistent': 3, 'complete': 3, 'actionable': 3,
+                'summary': 'Fallback scores due to parsing error'
+            }
+
+        # Single pass over the fixed key tuple: reject missing keys, coerce whole-number
+        # strings and floats (e.g. "4", 4.0) to ints, then range-check. Fractional values
+        # (4.7, "4.5") stay non-int and are rejected; `type() is int` also keeps JSON
+        # booleans from passing as 0/1.
+        coerced = False
+        for key in _PDQI_KEYS:
+            if key not in scores:
+                missing = sorted(_PDQI_KEYS_SET.difference(scores))
+                logger.error("Missing required keys in O3 response: %s", missing)
+                _debug_raw_content(content)
+                raise OpenAIResponseError(f"Invalid or malformed response from Azure OpenAI service: Missing keys: {missing}.")
+            value = scores[key]
+            if isinstance(value, str) and value.strip().replace('.', '', 1).isdigit():
+                number = float(value)
+                if number.is_integer():
+                    value = scores[key] = int(number)
+                    coerced = True
+            elif isinstance(value, float) and value.is_integer():
+                value = scores[key] = int(value)
+                coerced = True
+            if type(value) is not int or not 0 < value < 6:
+                logger.error("Invalid score for %s in O3 response: %r", key, value)
+                _debug_raw_content(content)
+                raise OpenAIResponseError(f"Invalid or malformed response from Azure OpenAI service: Invalid score for {key}.")
+        if coerced:
+            logger.warning("Coerced non-integer PDQI scores in O3 response")
+
+        # Validate enhanced dimension explanations if present
+        if 'dimension_explanations' in scores:
+            dimension_explanations = scores['dimension_explanations']
+            if isinstance(dimension_explanations, list):
+                for i, explanation in enumerate(dimension_explanations):
+                    if not isinstance(explanation, dict):
+                        logger.warning(f"Dimension explanation {i} is not a dict, skipping validation")
+                        continue
+                    
+                    # Validate required fields in each explanation
+                    required_explanation_keys = ['dimension', 'score', 'narrative']
+                    missing_keys = [k for k in required_explanation_keys if k not in explanation]
+                    if missing_keys:
+                        logger.warning(f"Dimension explanation {i} missing keys: {missing_keys}")
+                    
+                    # Validate dimension name is valid
+                    if 'dimension' in explanation and explanation['dimension'] not in _PDQI_KEYS_SET:
+                        logger.warning(f"Invalid dimension name in explanation {i}: {explanation['dimension']}")
+                    
+                    # Validate score consistency
+                    if ('dimension' in explanation and 'score' in explanation and 
+                        explanation['dimension'] in scores and 
+                        scores[explanation['dimension']] != explanation['score']):
+                        logger.warning(f"Score mismatch for {explanation['dimension']}: main={scores[explanation['dimension']]}, explanation={explanation['score']}")
+                
+                logger.info(f"Validated {len(dimension_explanations)} dimension explanations")
+            else:
+                logger.warning("dimension_explanations is not a list, ignoring enhanced validation")
+
+        return scores
 
     def _get_precision_instructions(self, model_precision: str) -> str:
         """Get system instructions modified based on precision level."""
-        base_instructions = Config.PDQI_INSTRUCTIONS
-        
-        if model_precision == "low":
-            # Fast mode - lighter instructions for quicker processing
-            return (
-                base_instructions
-                + "\n\nMODE: FAST - Provide concise evaluations with essential rationale only. Focus on clear, decisive scoring."
-                + "\nOUTPUT FORMAT NOTE (FAST): Return only the nine PDQI fields, a short 'summary', and an optional 'scoring_rationale'. Omit 'dimension_explanations' to keep the response compact."
-            )
-        elif model_precision == "high":
-            # Thorough mode - enhanced instructions for detailed analysis
-            return base_instructions + "\n\nMODE: THOROUGH - Provide comprehensive evaluations with detailed rationale, extensive evidence excerpts, and nuanced analysis. Take extra time to consider edge cases and provide thorough improvement suggestions."
-        else:
-            # Balanced mode - standard instructions
-            return base_instructions + "\n\nMODE: BALANCED - Provide well-reasoned evaluations with good balance of detail and efficiency."
-    
+        return self._precision_instructions.get(model_precision, self._precision_instructions["medium"])
+
     def _build_precision_kwargs(self, model_name: str, messages: list, model_precision: str) -> Dict[str, Any]:
         """Build API kwargs with precision-specific parameters."""
         kwargs = {
@@ -508,23 +728,60 @@ class O3Judge:
         # Add precision-specific parameters
         if model_precision == "low":
             # Fast mode - optimize for speed
-            if hasattr(Config, 'MAX_COMPLETION_TOKENS'):
-                kwargs["max_completion_tokens"] = min(Config.MAX_COMPLETION_TOKENS, 3000)
+            if self._max_tokens is not None:
+                kwargs["max_completion_tokens"] = min(self._max_tokens, 3000)
         elif model_precision == "high":
             # Thorough Ultra mode - optimize for maximum quality with 12K tokens
             kwargs["max_completion_tokens"] = 12000
         else:
             # Balanced mode - standard parameters
-            if hasattr(Config, 'MAX_COMPLETION_TOKENS') and Config.MAX_COMPLETION_TOKENS:
-                kwargs["max_completion_tokens"] = Config.MAX_COMPLETION_TOKENS
+            if self._max_tokens:
+                kwargs["max_completion_tokens"] = self._max_tokens
         
         logger.info(f"Built kwargs for precision {model_precision}: max_tokens={kwargs.get('max_completion_tokens', 'default')}")
         return kwargs
 
+# Module-level judge shared by `score_with_o3`.  The async client's connection pool is
+# bound to the event loop it was first used on, so the judge lives on a dedicated
+# background loop instead of a fresh `asyncio.run` loop per call.
+_JUDGE: Optional[O3Judge] = None
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _judge_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="o3-judge-loop", daemon=True).start()
+            _LOOP = loop
+        return _LOOP
+
+
+def _judge() -> O3Judge:
+    # Called only on the judge loop, so lazy construction needs no extra locking.
+    global _JUDGE
+    if _JUDGE is None:
+        _JUDGE = O3Judge()
+    return _JUDGE
+
+
+async def _score_once(clinical_note: str, model_precision: str) -> Dict[str, Any]:
+    return await _judge().score_pdqi9(clinical_note, model_precision=model_precision)
+
+
+async def _score_all_once(clinical_note: str) -> Dict[str, Dict[str, Any]]:
+    return await _judge().score_all_precisions(clinical_note)
+
+
 def score_with_o3(clinical_note: str, model_precision: str = "medium") -> Dict[str, Any]:
-    """Convenience function for scoring with O3."""
-    judge = O3Judge()
-    # Preserve backward-compat: only forward model_precision when caller explicitly overrides default
-    if model_precision == "medium":
-        return judge.score_pdqi9(clinical_note)
-    return judge.score_pdqi9(clinical_note, model_precision=model_precision)
\ No newline at end of file
+    """Convenience function for scoring with O3 (synchronous wrapper around a shared `O3Judge`)."""
+    future = asyncio.run_coroutine_threadsafe(_score_once(clinical_note, model_precision), _judge_loop())
+    return future.result()
+
+
+def score_all_precisions_with_o3(clinical_note: str) -> Dict[str, Dict[str, Any]]:
+    """Synchronous wrapper returning low/medium/high PDQI scores, fetched concurrently."""
+    future = asyncio.run_coroutine_threadsafe(_score_all_once(clinical_note), _judge_loop())
+    return future.result()
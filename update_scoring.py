@@ -1,32 +1,35 @@
 import re
 
-# Read the file
-with open('clinical_note_quality/services/grading_service.py', 'r', encoding='utf-8') as f:
-    content = f.read()
+# Specific rewrites are tried before the generic `pdqi.average` rule so that a single
+# left-to-right scan handles every case (no chained re.sub/str.replace passes).
+_REPLACEMENTS = {
+    # Display text
+    'f"Average Score: {pdqi.average:.2f}/5.0"':
+        'f"Total Score: {pdqi.total:.0f}/45 (Average: {(pdqi.total/9.0):.2f}/5.0)"',
+    # pdqi_average logging parameter
+    'pdqi_average=pdqi.average,': 'pdqi_total=pdqi.total,',
+    # Legacy return value
+    "'pdqi_average': result.pdqi.average,": "'pdqi_total': result.pdqi.total,",
+}
+_PATTERN = re.compile(
+    '|'.join(re.escape(old) for old in _REPLACEMENTS) + r'|(?P<prefix>(?:\w+\.)*)pdqi\.average'
+)
 
-# Replace instances systematically
-# 1. Replace pdqi.average with (pdqi.total/9.0) in calculations
-content = re.sub(r'pdqi\.average', '(pdqi.total/9.0)', content)
 
-# 2. Fix the specific instances for display text  
-content = content.replace(
-    'f"Average Score: {(pdqi.total/9.0):.2f}/5.0"',
-    'f"Total Score: {pdqi.total:.0f}/45 (Average: {(pdqi.total/9.0):.2f}/5.0)"'
-)
+def _rewrite(match: re.Match) -> str:
+    if match.group(0) in _REPLACEMENTS:
+        return _REPLACEMENTS[match.group(0)]
+    # Replace pdqi.average with (pdqi.total/9.0) in calculations, keeping any owner prefix
+    return f"({match.group('prefix')}pdqi.total/9.0)"
 
-# 3. Update the pdqi_average logging parameter
-content = content.replace(
-    'pdqi_average=(pdqi.total/9.0),',
-    'pdqi_total=pdqi.total,'
-)
 
-# 4. Update the legacy return value
-content = content.replace(
-    "'pdqi_average': result.pdqi.(pdqi.total/9.0),",
-    "'pdqi_total': result.pdqi.total,"
-)
+# Read the file
+with open('clinical_note_quality/services/grading_service.py', 'r', encoding='utf-8') as f:
+    content = f.read()
+
+content = _PATTERN.sub(_rewrite, content)
 
-# Write back the file  
+# Write back the file
 with open('clinical_note_quality/services/grading_service.py', 'w', encoding='utf-8') as f:
     f.write(content)
 
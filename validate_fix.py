@@ -1,5 +1,23 @@
 """Simple validation that the precision fix is working."""
 
+import mmap
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def _mapped(path):
+    """Map *path* read-only; use ``mm.find(b"...") != -1`` (``in`` does not search substrings on mmap).
+
+    An empty file cannot be mapped, so it yields ``b""`` (which matches nothing) instead.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
 print("PRECISION LEVEL FIX VALIDATION")
 print("=" * 40)
 
@@ -31,12 +49,10 @@ except ImportError as e:
 
 # Test 2: Check the frontend template has the new JavaScript
 try:
-    with open("templates/index.html", "r") as f:
-        content = f.read()
-    
-    assert "preventDefault()" in content, "Missing preventDefault in precision selection"
-    assert "dispatchEvent" in content, "Missing event dispatching"
-    assert "tabindex" in content, "Missing keyboard navigation support"
+    with _mapped("templates/index.html") as mm:
+        assert mm.find(b"preventDefault()") != -1, "Missing preventDefault in precision selection"
+        assert mm.find(b"dispatchEvent") != -1, "Missing event dispatching"
+        assert mm.find(b"tabindex") != -1, "Missing keyboard navigation support"
     
     print("✓ Frontend JavaScript enhanced for better radio button handling")
     
@@ -45,12 +61,10 @@ except FileNotFoundError:
 
 # Test 3: Check the CSS fixes are in place
 try:
-    with open("templates/base.html", "r") as f:
-        content = f.read()
-    
-    assert "precision-option" in content, "Missing precision-option CSS class"
-    assert "user-select: none" in content, "Missing user-select CSS fix"
-    assert "cursor: pointer" in content, "Missing cursor pointer fix"
+    with _mapped("templates/base.html") as mm:
+        assert mm.find(b"precision-option") != -1, "Missing precision-option CSS class"
+        assert mm.find(b"user-select: none") != -1, "Missing user-select CSS fix"
+        assert mm.find(b"cursor: pointer") != -1, "Missing cursor pointer fix"
     
     print("✓ CSS fixes applied for radio button selection issues")
     
@@ -59,14 +73,12 @@ except FileNotFoundError:
 
 # Test 4: Check that precision parameter differentiation is in place
 try:
-    with open("grading/o3_judge.py", "r") as f:
-        content = f.read()
-    
-    # Look for the new precision-based approach instead of deployment switching
-    assert "_get_precision_instructions" in content, "Missing precision instruction method"
-    assert "_build_precision_kwargs" in content, "Missing precision kwargs method"
-    assert "MODE: FAST" in content, "Missing fast mode instruction"
-    assert "MODE: THOROUGH" in content, "Missing thorough mode instruction"
+    with _mapped("grading/o3_judge.py") as mm:
+        # Look for the new precision-based approach instead of deployment switching
+        assert mm.find(b"_get_precision_instructions") != -1, "Missing precision instruction method"
+        assert mm.find(b"_build_precision_kwargs") != -1, "Missing precision kwargs method"
+        assert mm.find(b"MODE: FAST") != -1, "Missing fast mode instruction"
+        assert mm.find(b"MODE: THOROUGH") != -1, "Missing thorough mode instruction"
     
     print("✓ Backend uses parameter differentiation instead of deployment switching")
     
@@ -11,8 +11,11 @@ This script follows the TDD approach from Claude.md:
 import os
 import sys
 import asyncio
+import traceback
 from pathlib import Path
 
+import numpy as np
+
 # Ensure we can import our modules
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -33,27 +36,6 @@ class Week1Validator:
         self.tests_passed = 0
         self.tests_total = 0
     
-    def test(self, description: str):
-        """Decorator for test methods"""
-        def decorator(func):
-            def wrapper():
-                self.tests_total += 1
-                print(f"🧪 Testing: {description}")
-                try:
-                    result = func(self)
-                    if result:
-                        print("   ✅ PASSED")
-                        self.tests_passed += 1
-                    else:
-                        print("   ❌ FAILED")
-                    return result
-                except Exception as e:
-                    print(f"   ❌ ERROR: {e}")
-                    return False
-            return wrapper
-        return decorator
-    
-    @test("Domain models can be imported and instantiated")
     def test_domain_models(self):
         from clinical_note_quality.domain.semantic_models import (
             SemanticGap, SemanticGapResult, MedicalCategory
@@ -86,7 +68,6 @@ class Week1Validator:
         
         return True
     
-    @test("Service protocol defines correct interface")
     def test_service_protocol(self):
         from clinical_note_quality.services.semantic_protocols import SemanticGapDetectorProtocol
         
@@ -97,7 +78,6 @@ class Week1Validator:
         
         return True
     
-    @test("Azure client has embedding support")
     def test_azure_client_embedding_support(self):
         from clinical_note_quality.adapters.azure.async_client import (
             AsyncAzureLLMClient, AsyncLLMClientProtocol
@@ -113,7 +93,6 @@ class Week1Validator:
         
         return True
     
-    @test("Settings include embedding configuration")
     def test_settings_embedding_config(self):
         from clinical_note_quality import get_settings
         
@@ -135,7 +114,6 @@ class Week1Validator:
         
         return True
     
-    @test("SemanticGapDetector can be instantiated")
     def test_detector_instantiation(self):
         from clinical_note_quality.services.semantic_gap_detector import SemanticGapDetector
         
@@ -155,7 +133,6 @@ class Week1Validator:
         
         return True
     
-    @test("SemanticGapDetector has correct configuration")
     def test_detector_configuration(self):
         from clinical_note_quality.services.semantic_gap_detector import SemanticGapDetector
         from clinical_note_quality.domain.semantic_models import MedicalCategory
@@ -175,7 +152,7 @@ class Week1Validator:
     
     async def test_detector_async_functionality(self):
         """Test detector async functionality with mock data"""
-        print("🧪 Testing: SemanticGapDetector async functionality")
+        header = "🧪 Testing: SemanticGapDetector async functionality"
         try:
             from clinical_note_quality.services.semantic_gap_detector import SemanticGapDetector
             from clinical_note_quality.domain.semantic_models import MedicalCategory
@@ -183,14 +160,13 @@ class Week1Validator:
             # Mock client with different embeddings for different content
             class SmartMockClient:
                 async def create_embeddings(self, texts, model):
-                    embeddings = []
-                    for text in texts:
-                        if "allergy" in text.lower() or "allergic" in text.lower():
-                            embeddings.append([0.9] + [0.1] * 1535)  # Allergy embedding
-                        elif "medication" in text.lower() or "metformin" in text.lower():
-                            embeddings.append([0.1, 0.9] + [0.1] * 1534)  # Medication embedding
-                        else:
-                            embeddings.append([0.1] * 1536)  # Generic embedding
+                    lowered = [text.lower() for text in texts]
+                    allergy = np.array([("allergy" in t or "allergic" in t) for t in lowered], dtype=bool)
+                    medication = np.array([("medication" in t or "metformin" in t) for t in lowered], dtype=bool)
+                    # Generic embedding everywhere, then mark the discriminating dimension
+                    embeddings = np.full((len(texts), 1536), 0.1, dtype=np.float32)
+                    embeddings[allergy, 0] = 0.9  # Allergy embedding
+                    embeddings[medication & ~allergy, 1] = 0.9  # Medication embedding
                     return embeddings
                 
                 async def close(self):
@@ -224,17 +200,25 @@ class Week1Validator:
             # Check processing time
             assert result.processing_time > 0, "Should record processing time"
             
-            print("   ✅ PASSED")
-            self.tests_passed += 1
+            print(f"{header}\n   ✅ PASSED")
             return True
             
         except Exception as e:
-            print(f"   ❌ ERROR: {e}")
-            import traceback
+            print(f"{header}\n   ❌ ERROR: {e}")
             traceback.print_exc()
             return False
-        finally:
-            self.tests_total += 1
+    
+    @staticmethod
+    def _run_check(description, check):
+        """Run one sync check; prints the outcome in a single write so checks on
+        worker threads do not interleave their output."""
+        try:
+            result = bool(check())
+            status = "   ✅ PASSED" if result else "   ❌ FAILED"
+        except Exception as e:
+            result, status = False, f"   ❌ ERROR: {e}"
+        print(f"🧪 Testing: {description}\n{status}")
+        return result
     
     async def run_all_tests(self):
         """Run all validation tests"""
@@ -243,16 +227,22 @@ class Week1Validator:
         print("Testing Layer 1: Semantic Gap Detection Enhancement")
         print()
         
-        # Run sync tests
-        self.test_domain_models()
-        self.test_service_protocol()
-        self.test_azure_client_embedding_support()
-        self.test_settings_embedding_config()
-        self.test_detector_instantiation()
-        self.test_detector_configuration()
-        
-        # Run async test
-        await self.test_detector_async_functionality()
+        checks = [
+            ("Domain models can be imported and instantiated", self.test_domain_models),
+            ("Service protocol defines correct interface", self.test_service_protocol),
+            ("Azure client has embedding support", self.test_azure_client_embedding_support),
+            ("Settings include embedding configuration", self.test_settings_embedding_config),
+            ("SemanticGapDetector can be instantiated", self.test_detector_instantiation),
+            ("SemanticGapDetector has correct configuration", self.test_detector_configuration),
+        ]
+        # Sync checks run on worker threads alongside the async check; tallies are
+        # reduced from the gathered results instead of shared counters.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._run_check, description, check) for description, check in checks),
+            self.test_detector_async_functionality(),
+        )
+        self.tests_total = len(results)
+        self.tests_passed = results.count(True)
         
         print("\n" + "=" * 60)
         print(f"📊 Test Results: {self.tests_passed}/{self.tests_total} passed")
@@ -1,7 +1,17 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any
 
-@dataclass
+_PDQI_TEXT_FIELDS = frozenset({"summary", "rationale"})
+
+
+def _safe_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass(slots=True)
 class GradingViewModel:
     """Normalize grading result into numeric-friendly view model."""
     pdqi_scores: Dict[str, Any]
@@ -16,15 +26,10 @@ class GradingViewModel:
     @classmethod
     def from_result(cls, result: Dict[str, Any]):
         # Deep-copy PDQI scores and ensure numeric types
-        pdqi_scores: Dict[str, Any] = {}
-        for k, v in result.get("pdqi_scores", {}).items():
-            if k in {"summary", "rationale"}:
-                pdqi_scores[k] = v
-            else:
-                try:
-                    pdqi_scores[k] = float(v)
-                except (TypeError, ValueError):
-                    pdqi_scores[k] = 0.0
+        pdqi_scores: Dict[str, Any] = {
+            k: v if k in _PDQI_TEXT_FIELDS else _safe_float(v)
+            for k, v in result.get("pdqi_scores", {}).items()
+        }
         return cls(
             pdqi_scores=pdqi_scores,
             pdqi_total=float(result.get("pdqi_total", 0)),  # Changed from pdqi_average to pdqi_total
@@ -37,4 +42,15 @@ class GradingViewModel:
         )
 
     def as_dict(self) -> Dict[str, Any]:
-        return asdict(self) 
\ No newline at end of file
+        # Shallow on purpose: callers only read the nested dicts, so the recursive
+        # copy done by dataclasses.asdict() is unnecessary.
+        return {
+            "pdqi_scores": self.pdqi_scores,
+            "pdqi_total": self.pdqi_total,
+            "heuristic_analysis": self.heuristic_analysis,
+            "factuality_analysis": self.factuality_analysis,
+            "hybrid_score": self.hybrid_score,
+            "overall_grade": self.overall_grade,
+            "weights_used": self.weights_used,
+            "chain_of_thought": self.chain_of_thought,
+        } 
\ No newline at end of file
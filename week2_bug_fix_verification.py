@@ -4,82 +4,78 @@ Week 2 Final Verification - Field Mapping Fix Applied
 Verify the hallucination detection field mapping fix works correctly.
 """
 
-def verify_week2_fix():
-    """Verify Week 2 implementation after field mapping fixes."""
-    
-    print("🔧 WEEK 2 BUG FIX VERIFICATION")
-    print("=" * 40)
-    
-    print("✅ BUG IDENTIFIED AND FIXED:")
-    print("   Issue: Hallucination field name mismatch")
-    print("   - HallucinationDetector was using 'note_statement' field")
-    print("   - Hallucination domain model expects 'claim' field")
-    print("   - Template was using 'claim_text' and 'explanation'") 
-    print("   - Domain model has 'claim' and 'recommendation'")
-    
-    print("\n🔧 FIXES APPLIED:")
-    print("   1. Updated hallucination_detector.py:")
-    print("      - Changed 'note_statement=claim' → 'claim=claim'")
-    print("      - Changed 'explanation=' → 'recommendation='")
-    print("      - Changed 'unsupported_details=' → 'context_similarity='")
-    print("      - Fixed variable name: 'transcript_similarity' → 'max_similarity'")
-    
-    print("\n   2. Updated result.html template:")
-    print("      - Changed '{{ hallucination.claim_text }}' → '{{ hallucination.claim }}'")
-    print("      - Changed '{{ hallucination.explanation }}' → '{{ hallucination.recommendation }}'")
-    print("      - Changed '{{ contradiction.note_segment }}' → '{{ contradiction.note_statement }}'")
-    print("      - Changed '{{ contradiction.transcript_segment }}' → '{{ contradiction.transcript_statement }}'")
-    
-    print("\n✅ VERIFICATION RESULTS FROM LOG ANALYSIS:")
-    print("   🔍 Embedding API calls successful:")
-    print("      - text-embedding-3-large/embeddings: HTTP 200 OK")
-    print("      - Embedding analysis completed in 2.05s")
-    
-    print("\n   📊 Core functionality working:")
-    print("      - PDQI-9 scoring: ✅ Completed successfully")
-    print("      - Factuality analysis: ✅ Score=5, 3 claims analyzed")
-    print("      - Heuristic analysis: ✅ No errors")
-    print("      - ContradictionDetector: ✅ No errors (working correctly)")
-    
-    print("\n   🐛 Bug status:")
-    print("      - BEFORE: TypeError: unexpected keyword argument 'note_statement'")
-    print("      - AFTER: Fixed field mappings, should work correctly")
-    
-    print("\n   🖥️  UI Integration:")
-    print("      - Template has 'discrepancy_analysis' key: ✅")
-    print("      - All expected result keys present: ✅")
-    print("      - Embedding-based UI sections added: ✅")
-    
-    print("\n🧪 TESTING STATUS:")
-    print("   - Simple Browser opened at http://localhost:5000")
-    print("   - App is running and accessible")
-    print("   - Ready for end-to-end testing with transcript input")
-    
-    print("\n📋 NEXT TESTING STEPS:")
-    print("   1. Open http://localhost:5000 in browser")
-    print("   2. Enter a clinical note in the text area")
-    print("   3. Enter encounter transcript (required for embedding analysis)")
-    print("   4. Submit the form")
-    print("   5. Verify 'Embedding-Based Discrepancy Analysis' section appears")
-    print("   6. Check for contradiction and hallucination results")
-    
-    print("\n🎉 WEEK 2 STATUS: BUG FIXED - READY FOR TESTING!")
-    print("=" * 50)
-    print("The field mapping bug has been resolved. The Ultra-Thinking")
-    print("Layered Embedding Enhancement should now work correctly")
-    print("with proper contradiction and hallucination detection.")
-    
-    return True
+import sys
 
+# Reports are built once at import and written with a single call each
+_FIX_REPORT = """\
+🔧 WEEK 2 BUG FIX VERIFICATION
+========================================
+✅ BUG IDENTIFIED AND FIXED:
+   Issue: Hallucination field name mismatch
+   - HallucinationDetector was using 'note_statement' field
+   - Hallucination domain model expects 'claim' field
+   - Template was using 'claim_text' and 'explanation'
+   - Domain model has 'claim' and 'recommendation'
 
-def show_sample_test_data():
-    """Show sample data that should trigger embedding analysis."""
-    
-    print("\n📝 SAMPLE TEST DATA FOR VERIFICATION:")
-    print("-" * 40)
-    
-    print("🏥 Clinical Note (copy this into the web form):")
-    print('"' + '''Patient: John Smith, 65-year-old male
+🔧 FIXES APPLIED:
+   1. Updated hallucination_detector.py:
+      - Changed 'note_statement=claim' → 'claim=claim'
+      - Changed 'explanation=' → 'recommendation='
+      - Changed 'unsupported_details=' → 'context_similarity='
+      - Fixed variable name: 'transcript_similarity' → 'max_similarity'
+
+   2. Updated result.html template:
+      - Changed '{{ hallucination.claim_text }}' → '{{ hallucination.claim }}'
+      - Changed '{{ hallucination.explanation }}' → '{{ hallucination.recommendation }}'
+      - Changed '{{ contradiction.note_segment }}' → '{{ contradiction.note_statement }}'
+      - Changed '{{ contradiction.transcript_segment }}' → '{{ contradiction.transcript_statement }}'
+
+✅ VERIFICATION RESULTS FROM LOG ANALYSIS:
+   🔍 Embedding API calls successful:
+      - text-embedding-3-large/embeddings: HTTP 200 OK
+      - Embedding analysis completed in 2.05s
+
+   📊 Core functionality working:
+      - PDQI-9 scoring: ✅ Completed successfully
+      - Factuality analysis: ✅ Score=5, 3 claims analyzed
+      - Heuristic analysis: ✅ No errors
+      - ContradictionDetector: ✅ No errors (working correctly)
+
+   🐛 Bug status:
+      - BEFORE: TypeError: unexpected keyword argument 'note_statement'
+      - AFTER: Fixed field mappings, should work correctly
+
+   🖥️  UI Integration:
+      - Template has 'discrepancy_analysis' key: ✅
+      - All expected result keys present: ✅
+      - Embedding-based UI sections added: ✅
+
+🧪 TESTING STATUS:
+   - Simple Browser opened at http://localhost:5000
+   - App is running and accessible
+   - Ready for end-to-end testing with transcript input
+
+📋 NEXT TESTING STEPS:
+   1. Open http://localhost:5000 in browser
+   2. Enter a clinical note in the text area
+   3. Enter encounter transcript (required for embedding analysis)
+   4. Submit the form
+   5. Verify 'Embedding-Based Discrepancy Analysis' section appears
+   6. Check for contradiction and hallucination results
+
+🎉 WEEK 2 STATUS: BUG FIXED - READY FOR TESTING!
+==================================================
+The field mapping bug has been resolved. The Ultra-Thinking
+Layered Embedding Enhancement should now work correctly
+with proper contradiction and hallucination detection.
+"""
+
+_SAMPLE_DATA_REPORT = """\
+
+📝 SAMPLE TEST DATA FOR VERIFICATION:
+----------------------------------------
+🏥 Clinical Note (copy this into the web form):
+"Patient: John Smith, 65-year-old male
     
 Chief Complaint: Chest pain for 2 hours
 
@@ -91,10 +87,10 @@ Assessment:
 Plan:
 - Discharge home with cardiology follow-up
 - Start aspirin 81mg daily
-- Patient education completed''' + '"')
-    
-    print("\n📞 Encounter Transcript (copy this too):")
-    print('"' + '''Doctor: Tell me about the chest pain.
+- Patient education completed"
+
+📞 Encounter Transcript (copy this too):
+"Doctor: Tell me about the chest pain.
 Patient: Started about 30 minutes ago, very mild.
 
 Doctor: Your EKG is concerning - I see ST elevation here.
@@ -104,21 +100,33 @@ Patient: What does that mean?
 
 Doctor: We need to admit you for observation. 
 This looks like it could be a heart attack.
-Cardiology will see you in the morning.''' + '"')
-    
-    print("\n🔍 Expected Analysis Results:")
-    print("   📊 Contradictions should be found:")
-    print("   - EKG: 'normal sinus rhythm' vs 'ST elevation'")
-    print("   - Troponin: '0.8 ng/mL elevated' vs '0.02 normal'")
-    print("   - Plan: 'discharge home' vs 'admit for observation'")
-    print("   - Timeline: '2 hours' vs '30 minutes'")
-    
-    print("\n   ⚠️  Hallucinations should be detected:")
-    print("   - Any unsupported claims in the note")
-    print("   - Claims not backed by transcript evidence")
-    
-    print("\nIf embedding analysis appears with these results,")
-    print("Week 2 implementation is working correctly! 🎯")
+Cardiology will see you in the morning."
+
+🔍 Expected Analysis Results:
+   📊 Contradictions should be found:
+   - EKG: 'normal sinus rhythm' vs 'ST elevation'
+   - Troponin: '0.8 ng/mL elevated' vs '0.02 normal'
+   - Plan: 'discharge home' vs 'admit for observation'
+   - Timeline: '2 hours' vs '30 minutes'
+
+   ⚠️  Hallucinations should be detected:
+   - Any unsupported claims in the note
+   - Claims not backed by transcript evidence
+
+If embedding analysis appears with these results,
+Week 2 implementation is working correctly! 🎯
+"""
+
+
+def verify_week2_fix():
+    """Verify Week 2 implementation after field mapping fixes."""
+    sys.stdout.write(_FIX_REPORT)
+    return True
+
+
+def show_sample_test_data():
+    """Show sample data that should trigger embedding analysis."""
+    sys.stdout.write(_SAMPLE_DATA_REPORT)
 
 
 if __name__ == "__main__":